@@ -4,6 +4,8 @@ This module centralizes configuration so the rest of the codebase reads from a
 single validated settings object instead of scattered environment access.
 """
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -51,6 +53,21 @@ class Settings(BaseSettings):
         return self.database_url
 
 
-# Export a singleton settings object so application modules reuse one validated
-# configuration instance instead of re-reading environment variables repeatedly.
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings instance, validating the environment once.
+
+    Tests that change environment variables call `get_settings.cache_clear()`
+    to have the next lookup re-read them.
+    """
+
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    """Resolve `settings` lazily so `from app.config import settings` keeps working."""
+
+    if name == "settings":
+        return get_settings()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
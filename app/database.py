@@ -5,6 +5,7 @@ share a single database instance without table-name collisions.
 """
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
 from sqlalchemy import MetaData, text
 from sqlalchemy.ext.asyncio import (
@@ -15,7 +16,7 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase
 
-from app.config import settings
+from app.config import get_settings, settings
 
 # A naming convention keeps Alembic autogeneration stable and produces readable
 # constraint names across development, CI, and production environments.
@@ -42,7 +43,7 @@ class Base(DeclarativeBase):
 def get_async_database_url() -> str:
     """Return the configured database URL using the asyncpg SQLAlchemy driver."""
 
-    url = settings.active_db_url
+    url = get_settings().active_db_url
 
     if url.startswith("postgresql://"):
         return url.replace("postgresql://", "postgresql+asyncpg://", 1)
@@ -53,27 +54,43 @@ def get_async_database_url() -> str:
     return url
 
 
-def _build_connect_args() -> dict[str, dict[str, str]]:
-    """Return connection options needed to set PostgreSQL search_path.
+# Hot lookups (e.g. the daily theme resolution) reuse identical SQL, so keep
+# their server-side prepared statements cached per connection.
+STATEMENT_CACHE_SIZE = 256
+
+
+def _build_connect_args() -> dict[str, Any]:
+    """Return connection options for search_path and prepared statement caching.
 
     The asyncpg driver supports `server_settings`, which makes each connection
-    default to the application schema without manual per-session SQL.
+    default to the application schema without manual per-session SQL, and
+    caches prepared statements so repeated queries skip server-side parse/plan.
     """
 
     if get_async_database_url().startswith("postgresql+asyncpg://"):
-        return {"server_settings": {"search_path": settings.db_schema}}
+        return {
+            "server_settings": {"search_path": get_settings().db_schema},
+            "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+            "statement_cache_size": STATEMENT_CACHE_SIZE,
+        }
 
     return {}
 
 
+def build_engine() -> AsyncEngine:
+    """Create an async engine from the current settings without opening a connection."""
+
+    return create_async_engine(
+        get_async_database_url(),
+        connect_args=_build_connect_args(),
+        echo=get_settings().app_env.lower() == "development",
+        pool_pre_ping=True,
+    )
+
+
 # The engine is created once and shared across the process, but it does not
 # establish a network connection until the application actually uses it.
-engine: AsyncEngine = create_async_engine(
-    get_async_database_url(),
-    connect_args=_build_connect_args(),
-    echo=settings.app_env.lower() == "development",
-    pool_pre_ping=True,
-)
+engine: AsyncEngine = build_engine()
 
 
 # A dedicated async session factory gives each FastAPI request an isolated unit
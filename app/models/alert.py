@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func, text
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.config import settings
@@ -19,9 +19,17 @@ class Alert(Base):
     """A moderation or infringement alert related to a card or external listing."""
 
     __tablename__ = "alerts"
-    __table_args__ = {"schema": settings.db_schema}
+    __table_args__ = (
+        Index(
+            "ix_alerts_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 128},
+        ),
+        {"schema": settings.db_schema},
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     alert_type: Mapped[str] = mapped_column(String(20), nullable=False)
     card_id: Mapped[int | None] = mapped_column(
         ForeignKey(f"{settings.db_schema}.cards.id"),
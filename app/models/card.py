@@ -6,7 +6,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text, func, text
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Numeric, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,9 +25,17 @@ class Card(Base):
     """A generated greeting card asset and its production metadata."""
 
     __tablename__ = "cards"
-    __table_args__ = {"schema": settings.db_schema}
+    __table_args__ = (
+        Index(
+            "ix_cards_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 128},
+        ),
+        {"schema": settings.db_schema},
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     event_id: Mapped[int | None] = mapped_column(
         ForeignKey(f"{settings.db_schema}.events.id"),
         nullable=True,
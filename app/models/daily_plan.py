@@ -50,6 +50,18 @@ class DailyContentPlan(Base):
         default=list,
         server_default=text("'{}'::text[]"),
     )
+    visual_style: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        default="",
+        server_default=text("''"),
+    )
+    instagram_hashtags: Mapped[list[str]] = mapped_column(
+        ARRAY(Text),
+        nullable=False,
+        default=list,
+        server_default=text("'{}'::text[]"),
+    )
     cards_generated: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
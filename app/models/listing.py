@@ -6,7 +6,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text, func
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Numeric, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.config import settings
@@ -21,13 +21,15 @@ class Listing(Base):
     """A marketplace listing that exposes a card for sale on a platform."""
 
     __tablename__ = "listings"
-    __table_args__ = {"schema": settings.db_schema}
+    __table_args__ = (
+        Index("ix_listings_card_id_cover", "card_id", "bundle_id", postgresql_include=["price", "listed_at"]),
+        {"schema": settings.db_schema},
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     card_id: Mapped[int] = mapped_column(
         ForeignKey(f"{settings.db_schema}.cards.id"),
         nullable=False,
-        index=True,
     )
     bundle_id: Mapped[int | None] = mapped_column(nullable=True)
     platform: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -6,7 +6,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, func
+from sqlalchemy import BigInteger, CheckConstraint, Computed, DateTime, ForeignKey, Index, Numeric, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.config import settings
@@ -20,9 +20,21 @@ class Sale(Base):
     """A completed sale derived from a marketplace listing."""
 
     __tablename__ = "sales"
-    __table_args__ = {"schema": settings.db_schema}
+    __table_args__ = (
+        Index(
+            "ix_sales_sale_date_brin",
+            "sale_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 128},
+        ),
+        CheckConstraint(
+            "platform_fee >= 0 AND gross_amount >= platform_fee",
+            name="platform_fee_within_gross",
+        ),
+        {"schema": settings.db_schema},
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     listing_id: Mapped[int] = mapped_column(
         ForeignKey(f"{settings.db_schema}.listings.id"),
         nullable=False,
@@ -31,7 +43,12 @@ class Sale(Base):
     platform: Mapped[str] = mapped_column(String(50), nullable=False)
     gross_amount: Mapped[Decimal] = mapped_column(Numeric(8, 2), nullable=False)
     platform_fee: Mapped[Decimal] = mapped_column(Numeric(8, 2), nullable=False)
-    net_amount: Mapped[Decimal] = mapped_column(Numeric(8, 2), nullable=False)
+    # Generated by Postgres; never set it on insert.
+    net_amount: Mapped[Decimal] = mapped_column(
+        Numeric(8, 2),
+        Computed("gross_amount - platform_fee", persisted=True),
+        nullable=False,
+    )
     sale_date: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func, text
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.config import settings
@@ -19,13 +19,21 @@ class SocialPost(Base):
     """A social media post published for a card on a specific platform."""
 
     __tablename__ = "social_posts"
-    __table_args__ = {"schema": settings.db_schema}
+    __table_args__ = (
+        Index("ix_social_posts_card_id_cover", "card_id", postgresql_include=["reach", "engagement", "link_clicks"]),
+        Index(
+            "ix_social_posts_posted_at_brin",
+            "posted_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 128},
+        ),
+        {"schema": settings.db_schema},
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     card_id: Mapped[int] = mapped_column(
         ForeignKey(f"{settings.db_schema}.cards.id"),
         nullable=False,
-        index=True,
     )
     platform: Mapped[str] = mapped_column(String(50), nullable=False)
     post_url: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Date, ForeignKey, Integer, String, Text, UniqueConstraint, text
+from sqlalchemy import Boolean, Date, ForeignKey, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -27,6 +27,12 @@ class WeeklyTheme(Base):
             "day_of_week",
             name="uq_weekly_themes_rotation_month_day_of_week",
         ),
+        Index(
+            "ix_weekly_themes_active_lookup",
+            "rotation_month",
+            "day_of_week",
+            postgresql_where=text("active"),
+        ),
         {"schema": settings.db_schema},
     )
 
@@ -78,7 +84,16 @@ class ThemeOverride(Base):
     """A higher-priority theme configuration that overrides weekly rotation."""
 
     __tablename__ = "theme_overrides"
-    __table_args__ = {"schema": settings.db_schema}
+    __table_args__ = (
+        Index(
+            "ix_theme_overrides_active_priority",
+            text("priority DESC"),
+            "start_date",
+            "end_date",
+            postgresql_where=text("active"),
+        ),
+        {"schema": settings.db_schema},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     override_type: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -6,6 +6,7 @@ import asyncio
 import calendar
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from functools import cache
 import os
 from pathlib import Path
 from typing import Any
@@ -125,6 +126,7 @@ async def build_dashboard_context(db: AsyncSession) -> dict[str, Any]:
     """Build the template context for the main admin dashboard."""
 
     today_theme = await theme_resolver.resolve_today(db)
+    await db.commit()
     now_ist = datetime.now(KOLKATA_TZ)
     today = now_ist.date()
     day_start, day_end = _ist_day_bounds(today)
@@ -224,11 +226,31 @@ def _resolve_theme_for_date(
 async def build_themes_context(db: AsyncSession) -> dict[str, Any]:
     """Build the themes page context with current rotation and override tools."""
 
-    weekly_result = await db.execute(select(WeeklyTheme).order_by(WeeklyTheme.rotation_month, WeeklyTheme.day_of_week))
-    weekly_themes = list(weekly_result.scalars().all())
-    override_result = await db.execute(select(ThemeOverride).order_by(ThemeOverride.start_date.desc(), ThemeOverride.priority.desc()))
-    overrides = list(override_result.scalars().all())
+    # Column rows instead of ORM entities: the page only reads a few scalars and
+    # never writes back, so identity-map hydration is pure overhead here.
+    weekly_result = await db.execute(
+        select(
+            WeeklyTheme.rotation_month,
+            WeeklyTheme.day_of_week,
+            WeeklyTheme.theme_name,
+            WeeklyTheme.tone_funny_pct,
+            WeeklyTheme.tone_emotion_pct,
+            WeeklyTheme.active,
+        ).order_by(WeeklyTheme.rotation_month, WeeklyTheme.day_of_week)
+    )
+    weekly_themes = list(weekly_result.all())
+    override_result = await db.execute(
+        select(
+            ThemeOverride.theme_name,
+            ThemeOverride.start_date,
+            ThemeOverride.end_date,
+            ThemeOverride.priority,
+            ThemeOverride.active,
+        ).order_by(ThemeOverride.start_date.desc(), ThemeOverride.priority.desc())
+    )
+    overrides = list(override_result.all())
     today_theme = await theme_resolver.resolve_today(db)
+    await db.commit()
     today = datetime.now(KOLKATA_TZ).date()
     upcoming_days = [_resolve_theme_for_date(today + timedelta(days=offset), weekly_themes, overrides) for offset in range(7)]
 
@@ -283,6 +305,17 @@ async def build_costs_context(db: AsyncSession) -> dict[str, Any]:
     }
 
 
+@cache
+def _migration_files() -> tuple[tuple[str, str], ...]:
+    """Return (revision, filename) pairs for the shipped revisions, scanned once per process."""
+
+    return tuple(
+        (path.name.split("_", 1)[0], path.name)
+        for path in sorted(MIGRATIONS_DIR.iterdir())
+        if path.is_file() and path.suffix == ".py" and path.name != "__init__.py"
+    )
+
+
 async def build_migrations_context(db: AsyncSession) -> dict[str, Any]:
     """Build the migrations page with local files and applied revision metadata."""
 
@@ -294,19 +327,14 @@ async def build_migrations_context(db: AsyncSession) -> dict[str, Any]:
     except Exception:
         current_version = "unavailable"
 
-    migration_files = sorted(
-        path for path in MIGRATIONS_DIR.iterdir() if path.is_file() and path.suffix == ".py" and path.name != "__init__.py"
-    )
-    migrations = []
-    for path in migration_files:
-        revision = path.name.split("_", 1)[0]
-        migrations.append(
-            {
-                "revision": revision,
-                "filename": path.name,
-                "applied": current_version != "unavailable" and revision <= current_version,
-            }
-        )
+    migrations = [
+        {
+            "revision": revision,
+            "filename": filename,
+            "applied": current_version != "unavailable" and revision <= current_version,
+        }
+        for revision, filename in _migration_files()
+    ]
 
     return {
         "nav_items": _nav_items(),
@@ -422,6 +450,7 @@ async def admin_create_theme_override(
     )
     db.add(override)
     await db.commit()
+    ThemeResolver.invalidate()
     return RedirectResponse(url="/admin/themes", status_code=status.HTTP_303_SEE_OTHER)
 
 
@@ -446,4 +475,6 @@ async def admin_run_migrations():
         cwd=str(BASE_DIR),
     )
     await process.communicate()
+    # Migrations can reseed weekly themes, so re-resolve today's theme.
+    ThemeResolver.invalidate()
     return RedirectResponse(url="/admin/migrations", status_code=status.HTTP_303_SEE_OTHER)
@@ -26,6 +26,7 @@ async def get_today_theme(db: AsyncSession = Depends(get_db)) -> ThemeResolved:
     """Resolve today's theme, persist it, and return the API response payload."""
 
     resolved_theme = await resolver.resolve_today(db)
+    await db.commit()
     return ThemeResolved.model_validate(resolved_theme)
 
 
@@ -60,5 +61,6 @@ async def create_theme_override(
     override = ThemeOverride(**payload.model_dump())
     db.add(override)
     await db.commit()
+    ThemeResolver.invalidate()
     await db.refresh(override)
     return ThemeOverrideResponse.model_validate(override)
@@ -33,6 +33,8 @@ class ThemeHistoryItem(BaseModel):
     tone_emotion_pct: int
     prompt_keywords: list[str]
     color_palette: list[str]
+    visual_style: str
+    instagram_hashtags: list[str]
     cards_generated: int
     status: str
 
@@ -8,7 +8,6 @@ from typing import Any
 
 from fastapi import HTTPException, status
 import httpx
-from PIL import Image, UnidentifiedImageError
 
 from app.config import settings
 from app.database import async_session_factory
@@ -164,6 +163,9 @@ class DalleService:
                 "error": "Image file exceeds 10MB.",
             }
 
+        # Imported here so workers that never validate images skip loading Pillow.
+        from PIL import Image, UnidentifiedImageError
+
         try:
             image = Image.open(BytesIO(response.content))
             width, height = image.size
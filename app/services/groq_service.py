@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from typing import Any
 
 from fastapi import HTTPException, status
 import httpx
+import orjson
 
 from app.config import settings
 
@@ -254,16 +254,16 @@ class GroqService:
 
         candidate = content.strip()
         try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
+            return orjson.loads(candidate)
+        except orjson.JSONDecodeError:
             pass
 
         start = candidate.find("{")
         end = candidate.rfind("}")
         if start != -1 and end != -1 and end > start:
             try:
-                return json.loads(candidate[start : end + 1])
-            except json.JSONDecodeError:
+                return orjson.loads(candidate[start : end + 1])
+            except orjson.JSONDecodeError:
                 return None
 
         return None
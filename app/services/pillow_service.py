@@ -2,13 +2,57 @@
 
 from __future__ import annotations
 
+from functools import cache, lru_cache
 from io import BytesIO
-import math
-from textwrap import wrap
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 from fastapi import HTTPException
 import httpx
-from PIL import Image, ImageColor, ImageDraw, ImageFont, ImageOps, UnidentifiedImageError
+
+if TYPE_CHECKING:
+    from PIL import Image, ImageDraw
+
+
+@cache
+def _pil() -> SimpleNamespace:
+    """Import the Pillow submodules on first use so webhook-only workers skip them."""
+
+    from PIL import Image, ImageColor, ImageDraw, ImageFont, ImageOps, UnidentifiedImageError
+
+    return SimpleNamespace(
+        Image=Image,
+        ImageColor=ImageColor,
+        ImageDraw=ImageDraw,
+        ImageFont=ImageFont,
+        ImageOps=ImageOps,
+        UnidentifiedImageError=UnidentifiedImageError,
+    )
+
+
+@lru_cache(maxsize=128)
+def resolve_color(color_value: str, fallback: str = "#1F2937") -> tuple[int, int, int]:
+    """Parse a palette color into an RGB tuple once, falling back if it is invalid."""
+
+    image_color = _pil().ImageColor
+    try:
+        return image_color.getcolor(color_value, "RGB")
+    except ValueError:
+        return image_color.getcolor(fallback, "RGB")
+
+
+@lru_cache(maxsize=32)
+def load_font(size: int):
+    """Load the card font at one size once, searching sans-serif faces before the default."""
+
+    image_font = _pil().ImageFont
+    for font_name in ("DejaVuSans.ttf", "Arial.ttf", "Helvetica.ttf"):
+        try:
+            return image_font.truetype(font_name, size=size)
+        except OSError:
+            continue
+
+    return image_font.load_default()
 
 
 class PillowService:
@@ -22,6 +66,9 @@ class PillowService:
     DEFAULT_BORDER = "#1F2937"
     DEFAULT_OVERLAY_ALPHA = 153
 
+    # Watermark text is constant, so its bbox only varies with the font size.
+    _WM_BBOX_CACHE: dict[int, tuple[int, int, int, int]] = {}
+
     async def assemble_card(
         self,
         image_url: str,
@@ -37,7 +84,7 @@ class PillowService:
         composed = self._compose_image(
             image=image,
             phrase=phrase,
-            color_palette=color_palette,
+            border_color=self._border_color(color_palette),
             size=self.PRODUCTION_SIZE,
             include_watermark=True,
         )
@@ -56,7 +103,7 @@ class PillowService:
         composed = self._compose_image(
             image=image,
             phrase=phrase,
-            color_palette=color_palette,
+            border_color=self._border_color(color_palette),
             size=self.PREVIEW_SIZE,
             include_watermark=False,
         )
@@ -83,20 +130,53 @@ class PillowService:
 
         lines.append(current_line)
 
-        # If a single word still exceeds the width, fall back to a simple
-        # character-count wrap so extremely long tokens do not overflow.
+        # If a single word still exceeds the width, slice it by per-character
+        # advance widths so extremely long tokens do not overflow.
+        char_cache: dict[str, float] = {}
         wrapped_lines: list[str] = []
         for line in lines:
             if draw.textlength(line, font=font) <= max_width:
                 wrapped_lines.append(line)
                 continue
 
-            avg_char_width = max(draw.textlength("ABCDEFGHIJKLMNOPQRSTUVWXYZ", font=font) / 26, 1)
-            max_chars = max(1, math.floor(max_width / avg_char_width))
-            wrapped_lines.extend(wrap(line, width=max_chars))
+            wrapped_lines.extend(self._greedy_wrap_by_width(line, font, max_width, char_cache, draw))
 
         return wrapped_lines
 
+    def _greedy_wrap_by_width(
+        self,
+        line: str,
+        font,
+        max_width: int,
+        char_cache: dict[str, float],
+        draw,
+    ) -> list[str]:
+        """Split one line into chunks that fit the width as measured by ``draw.textlength``."""
+
+        chunks: list[str] = []
+        start = 0
+        while start < len(line):
+            end = start
+            width = 0.0
+            while end < len(line):
+                advance = char_cache.get(line[end])
+                if advance is None:
+                    advance = char_cache[line[end]] = font.getlength(line[end])
+                if width + advance > max_width and end > start:
+                    break
+                width += advance
+                end += 1
+
+            # Summed advances ignore kerning, so they are only a first guess:
+            # hand characters to the next chunk while the measured text overflows.
+            while end - start > 1 and draw.textlength(line[start:end], font=font) > max_width:
+                end -= 1
+
+            chunks.append(line[start:end].strip())
+            start = end
+
+        return [chunk for chunk in chunks if chunk]
+
     def _auto_font_size(self, phrase: str) -> int:
         """Return a font size based on the phrase word count."""
 
@@ -117,9 +197,10 @@ class PillowService:
         except httpx.HTTPError as exc:
             raise HTTPException(status_code=502, detail=f"Failed to download image: {exc}") from exc
 
+        pil = _pil()
         try:
-            return Image.open(BytesIO(response.content)).convert("RGBA")
-        except UnidentifiedImageError as exc:
+            return pil.Image.open(BytesIO(response.content)).convert("RGBA")
+        except pil.UnidentifiedImageError as exc:
             raise HTTPException(status_code=422, detail="Downloaded file is not a valid image") from exc
 
     def _compose_image(
@@ -127,17 +208,21 @@ class PillowService:
         *,
         image: Image.Image,
         phrase: str,
-        color_palette: list[str],
+        border_color: tuple[int, int, int] | str,
         size: int,
         include_watermark: bool,
     ) -> Image.Image:
         """Resize, decorate, and render the source image into the final card."""
 
-        border_color = self._safe_color(color_palette[0] if color_palette else self.DEFAULT_BORDER)
+        pil = _pil()
         bordered_size = size - (self.BORDER_WIDTH * 2)
-        canvas = Image.new("RGBA", (size, size), border_color)
-        fitted = ImageOps.fit(image, (bordered_size, bordered_size), method=Image.Resampling.LANCZOS)
+        # Cards are always opaque, so keep the canvas RGB and skip the alpha
+        # channel (and the RGBA->RGB convert) end to end.
+        canvas = pil.Image.new("RGB", (size, size), border_color)
+        fitted = pil.ImageOps.fit(image, (bordered_size, bordered_size), method=pil.Image.Resampling.LANCZOS)
         canvas.paste(fitted, (self.BORDER_WIDTH, self.BORDER_WIDTH))
+        # One drawing context per card, shared by text layout, text and watermark.
+        draw = pil.ImageDraw.Draw(canvas, "RGBA")
 
         overlay_height = int(size * self.OVERLAY_RATIO)
         self._apply_bottom_gradient(
@@ -147,7 +232,6 @@ class PillowService:
             max_alpha=self.DEFAULT_OVERLAY_ALPHA,
         )
 
-        draw = ImageDraw.Draw(canvas, "RGBA")
         font_size = self._scaled_font_size(size=size, base_size=self._auto_font_size(phrase))
         font = self._get_font(font_size)
         max_width = int(size * 0.80)
@@ -178,20 +262,16 @@ class PillowService:
     ) -> None:
         """Apply a dark vertical gradient over the bottom text area."""
 
-        gradient = Image.new("RGBA", image.size, (0, 0, 0, 0))
-        gradient_draw = ImageDraw.Draw(gradient, "RGBA")
+        pil = _pil()
         height = max(overlay_bottom - overlay_top, 1)
+        # Integer-only alpha ramp, one byte per row, stretched across the width.
+        ramp = bytes(max_alpha * (index + 1) // height for index in range(height))
+        mask = pil.Image.frombytes("L", (1, height), ramp).resize(
+            (image.width, height),
+            resample=pil.Image.Resampling.NEAREST,
+        )
 
-        for index in range(height):
-            alpha = int(max_alpha * ((index + 1) / height))
-            y = overlay_top + index
-            gradient_draw.line(
-                [(0, y), (image.width, y)],
-                fill=(0, 0, 0, alpha),
-                width=1,
-            )
-
-        image.alpha_composite(gradient)
+        image.paste((0, 0, 0), (0, overlay_top, image.width, overlay_top + height), mask=mask)
 
     def _draw_centered_text(
         self,
@@ -227,7 +307,13 @@ class PillowService:
     def _draw_watermark(self, *, draw: ImageDraw.ImageDraw, size: int, font) -> None:
         """Render the service watermark in the bottom-right corner."""
 
-        bbox = draw.textbbox((0, 0), self.WATERMARK_TEXT, font=font)
+        font_size = getattr(font, "size", 0)
+        bbox = self._WM_BBOX_CACHE.get(font_size)
+        if bbox is None:
+            bbox = self._WM_BBOX_CACHE.setdefault(
+                font_size,
+                draw.textbbox((0, 0), self.WATERMARK_TEXT, font=font),
+            )
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         padding = max(18, size // 50)
@@ -241,27 +327,17 @@ class PillowService:
     def _get_font(self, size: int):
         """Return a clean sans-serif font if available, else Pillow's default."""
 
-        for font_name in ("DejaVuSans.ttf", "Arial.ttf", "Helvetica.ttf"):
-            try:
-                return ImageFont.truetype(font_name, size=size)
-            except OSError:
-                continue
-
-        return ImageFont.load_default()
+        return load_font(size)
 
     def _scaled_font_size(self, *, size: int, base_size: int) -> int:
         """Scale reference font sizes from 2100px production to the target size."""
 
         return max(18, round(base_size * (size / self.PRODUCTION_SIZE)))
 
-    def _safe_color(self, color_value: str) -> str:
-        """Validate and normalize a color string, falling back if invalid."""
+    def _border_color(self, color_palette: list[str]) -> tuple[int, int, int]:
+        """Resolve the palette's first color into a validated RGB border tuple."""
 
-        try:
-            ImageColor.getrgb(color_value)
-            return color_value
-        except ValueError:
-            return self.DEFAULT_BORDER
+        return resolve_color(color_palette[0] if color_palette else self.DEFAULT_BORDER, self.DEFAULT_BORDER)
 
     def _export_png(self, image: Image.Image) -> bytes:
         """Encode the final production card as a PNG under Etsy-friendly size limits."""
@@ -274,7 +350,7 @@ class PillowService:
         if len(png_bytes) <= 3 * 1024 * 1024:
             return png_bytes
 
-        quantized = candidate.convert("P", palette=Image.Palette.ADAPTIVE, colors=256)
+        quantized = candidate.convert("P", palette=_pil().Image.Palette.ADAPTIVE, colors=256)
         output = BytesIO()
         quantized.save(output, format="PNG", optimize=True, compress_level=9)
         png_bytes = output.getvalue()
@@ -285,7 +361,7 @@ class PillowService:
         """Encode the preview as a compact JPEG for chat delivery."""
 
         output = BytesIO()
-        image.convert("RGB").save(
+        image.save(
             output,
             format="JPEG",
             quality=88,
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from copy import deepcopy
 from dataclasses import dataclass
 from datetime import date, datetime
 import logging
-from typing import Any
+import time
+from types import MappingProxyType
+from typing import Any, ClassVar
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import or_, select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Date, Integer, Select, String, Text, bindparam, cast, event, literal, null, or_, select, union_all
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.models.daily_plan import DailyContentPlan
 from app.models.theme import ThemeOverride, WeeklyTheme
@@ -19,7 +23,7 @@ from app.models.theme import ThemeOverride, WeeklyTheme
 logger = logging.getLogger(__name__)
 
 KOLKATA_TZ = ZoneInfo("Asia/Kolkata")
-WEEKDAY_NAMES = [
+WEEKDAY_NAMES = (
     "monday",
     "tuesday",
     "wednesday",
@@ -27,9 +31,19 @@ WEEKDAY_NAMES = [
     "friday",
     "saturday",
     "sunday",
-]
-
-FALLBACK_THEME = {
+)
+# Indexed by calendar month (1-12); index 0 is unused padding.
+ROTATION_BY_MONTH = tuple(((month - 1) % 9) + 1 for month in range(13))
+
+# Cached resolutions are re-read after this long even without an explicit
+# invalidation, which bounds how stale another worker's cache can get.
+THEME_CACHE_TTL_SECONDS = 300.0
+# Session.info key holding a resolution that is cached once its upsert commits.
+PENDING_THEME_KEY = "theme_resolver.pending"
+
+# Read-only so callers and tests cannot mutate the defaults baked into the
+# resolve statement at import time.
+FALLBACK_THEME: Mapping[str, Any] = MappingProxyType({
     "theme_name": "Relatable / Everyday",
     "source": "fallback",
     "tone_funny_pct": 70,
@@ -38,7 +52,124 @@ FALLBACK_THEME = {
     "color_palette": [],
     "visual_style": "",
     "instagram_hashtags": [],
-}
+})
+
+
+def _theme_columns(model: type[ThemeOverride] | type[WeeklyTheme]) -> tuple[Any, ...]:
+    """Return the theme payload columns shared by overrides and weekly themes."""
+
+    return (
+        model.theme_name,
+        model.tone_funny_pct,
+        model.tone_emotion_pct,
+        model.prompt_keywords,
+        model.color_palette,
+        model.visual_style,
+        model.instagram_hashtags,
+    )
+
+
+def _build_resolve_statement() -> Select[Any]:
+    """Build one statement that picks override, weekly or fallback and upserts it.
+
+    Candidates are ranked (override 0, weekly 1, fallback 2) in a CTE, the
+    lowest rank wins, and a data-modifying CTE upserts the winner into the
+    daily plan table. The outer SELECT returns the full winning payload, so
+    the whole resolution costs a single database round-trip.
+
+    The statement is built once at import with ``plan_date``, ``rotation_month``
+    and ``weekday_name`` bind parameters, so every call reuses the same compiled
+    SQL and the connection's cached prepared statement.
+    """
+
+    plan_date = bindparam("plan_date", type_=Date)
+
+    override_candidate = (
+        select(
+            literal(0).label("rank"),
+            literal("override").label("source"),
+            ThemeOverride.id.label("override_id"),
+            cast(null(), Integer).label("weekly_theme_id"),
+            *_theme_columns(ThemeOverride),
+        )
+        .where(
+            ThemeOverride.active.is_(True),
+            ThemeOverride.start_date <= plan_date,
+            ThemeOverride.end_date >= plan_date,
+        )
+        .order_by(ThemeOverride.priority.desc())
+        .limit(1)
+    )
+    # Weekdays are stored as lowercase names (migration 015 backfilled any
+    # numeric rows), so a plain equality keeps the partial lookup index usable.
+    weekly_candidate = (
+        select(
+            literal(1),
+            literal("weekly"),
+            cast(null(), Integer),
+            WeeklyTheme.id,
+            *_theme_columns(WeeklyTheme),
+        )
+        .where(
+            WeeklyTheme.active.is_(True),
+            WeeklyTheme.rotation_month == bindparam("rotation_month", type_=Integer),
+            WeeklyTheme.day_of_week == bindparam("weekday_name", type_=String),
+        )
+        .limit(1)
+    )
+    fallback_candidate = select(
+        literal(2),
+        literal(FALLBACK_THEME["source"]),
+        cast(null(), Integer),
+        cast(null(), Integer),
+        literal(FALLBACK_THEME["theme_name"]),
+        literal(FALLBACK_THEME["tone_funny_pct"]),
+        literal(FALLBACK_THEME["tone_emotion_pct"]),
+        literal(FALLBACK_THEME["prompt_keywords"], ARRAY(Text)),
+        literal(FALLBACK_THEME["color_palette"], ARRAY(Text)),
+        literal(FALLBACK_THEME["visual_style"]),
+        literal(FALLBACK_THEME["instagram_hashtags"], ARRAY(Text)),
+    )
+    candidates = union_all(override_candidate, weekly_candidate, fallback_candidate).cte("candidates")
+    chosen = select(candidates).order_by(candidates.c.rank).limit(1).cte("chosen")
+
+    # The plan row carries the full resolved payload so readers never need to
+    # join back to theme_overrides / weekly_themes.
+    updated_columns = (
+        "theme_name",
+        "source",
+        "override_id",
+        "weekly_theme_id",
+        "tone_funny_pct",
+        "tone_emotion_pct",
+        "prompt_keywords",
+        "color_palette",
+        "visual_style",
+        "instagram_hashtags",
+        "status",
+    )
+    upsert = insert(DailyContentPlan).from_select(
+        ["plan_date", *updated_columns],
+        select(
+            plan_date,
+            *(chosen.c[column] for column in updated_columns[:-1]),
+            literal("resolved"),
+        ),
+    )
+    plan_columns = DailyContentPlan.__table__.c
+    # Skip the UPDATE (and its WAL write) when the stored plan already matches.
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[DailyContentPlan.plan_date],
+        set_={column: upsert.excluded[column] for column in updated_columns},
+        where=or_(
+            *(plan_columns[column].is_distinct_from(upsert.excluded[column]) for column in updated_columns)
+        ),
+    ).returning(DailyContentPlan.id)
+
+    return select(chosen).add_cte(upsert.cte("upserted"))
+
+
+RESOLVE_TODAY_STATEMENT = _build_resolve_statement()
 
 
 @dataclass(slots=True)
@@ -47,11 +178,27 @@ class ThemeResolver:
 
     now_provider: Callable[[], datetime] | None = None
 
+    # Shared by every resolver instance so an override write through any router
+    # invalidates the theme served by the others. Entries are keyed by the
+    # Kolkata plan date and only added after the caller commits the daily plan
+    # upsert. The cache is per process: other workers, migrations, weekly theme
+    # edits and direct database changes are picked up once an entry's TTL lapses.
+    _cache: ClassVar[dict[date, tuple[float, dict[str, Any]]]] = {}
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop cached resolutions so the next call re-reads overrides and weekly themes."""
+
+        cls._cache.clear()
+
     def _get_now(self) -> datetime:
         """Return the current timezone-aware datetime in Asia/Kolkata."""
 
         if self.now_provider is not None:
-            return self.now_provider()
+            # Injected clocks may use another zone; normalize once here so the
+            # default path never pays for a tz conversion.
+            now = self.now_provider()
+            return now if now.tzinfo is KOLKATA_TZ else now.astimezone(KOLKATA_TZ)
 
         return datetime.now(tz=KOLKATA_TZ)
 
@@ -71,191 +218,82 @@ class ThemeResolver:
     def get_rotation_month(current_month: int) -> int:
         """Return the rotation value using the explicit month formula provided."""
 
-        return ((current_month - 1) % 9) + 1
+        return ROTATION_BY_MONTH[current_month]
 
     async def resolve_today(self, session: AsyncSession) -> dict[str, Any]:
-        """Resolve today's theme and upsert it into the daily content plan table."""
-
-        today = self._get_now().astimezone(KOLKATA_TZ).date()
-
-        override = await self._get_override(session=session, today=today)
-        if override is not None:
-            resolved = self._build_resolved_theme(
-                source="override",
-                plan_date=today,
-                theme_name=override.theme_name,
-                tone_funny_pct=override.tone_funny_pct,
-                tone_emotion_pct=override.tone_emotion_pct,
-                prompt_keywords=override.prompt_keywords,
-                color_palette=override.color_palette,
-                visual_style=override.visual_style,
-                instagram_hashtags=override.instagram_hashtags,
-                override_id=override.id,
-                weekly_theme_id=None,
-            )
-            logger.info("Theme resolver selected override source")
-            await self._upsert_daily_plan(session=session, resolved=resolved)
-            return self._to_response(resolved=resolved)
-
-        weekly_theme = await self._get_weekly_theme(session=session, today=today)
-        if weekly_theme is not None:
-            resolved = self._build_resolved_theme(
-                source="weekly",
-                plan_date=today,
-                theme_name=weekly_theme.theme_name,
-                tone_funny_pct=weekly_theme.tone_funny_pct,
-                tone_emotion_pct=weekly_theme.tone_emotion_pct,
-                prompt_keywords=weekly_theme.prompt_keywords,
-                color_palette=weekly_theme.color_palette,
-                visual_style=weekly_theme.visual_style,
-                instagram_hashtags=weekly_theme.instagram_hashtags,
-                override_id=None,
-                weekly_theme_id=weekly_theme.id,
-            )
-            logger.info("Theme resolver selected weekly source")
-            await self._upsert_daily_plan(session=session, resolved=resolved)
-            return self._to_response(resolved=resolved)
-
-        resolved = {
-            **FALLBACK_THEME,
-            "plan_date": today,
-            "override_id": None,
-            "weekly_theme_id": None,
-        }
-        logger.info("Theme resolver selected fallback source")
-        await self._upsert_daily_plan(session=session, resolved=resolved)
-        return self._to_response(resolved=resolved)
-
-    async def _get_override(
-        self,
-        *,
-        session: AsyncSession,
-        today: date,
-    ) -> ThemeOverride | None:
-        """Return the highest-priority active override for the current day."""
-
-        statement = (
-            select(ThemeOverride)
-            .where(
-                ThemeOverride.active.is_(True),
-                ThemeOverride.start_date <= today,
-                ThemeOverride.end_date >= today,
-            )
-            .order_by(ThemeOverride.priority.desc())
-            .limit(1)
-        )
-        result = await session.execute(statement)
-        return result.scalar_one_or_none()
-
-    async def _get_weekly_theme(
-        self,
-        *,
-        session: AsyncSession,
-        today: date,
-    ) -> WeeklyTheme | None:
-        """Return the active weekly theme for the current weekday and rotation."""
-
-        weekday_index = self.get_weekday_index(today)
-        weekday_name = self.get_weekday_name(today)
-        rotation_month = self.get_rotation_month(today.month)
-
-        # The prompt specifies Monday=0 weekday matching. The current seeded data
-        # stores weekday names, so the query accepts both numeric-string and name
-        # values to remain compatible with existing rows.
-        statement = (
-            select(WeeklyTheme)
-            .where(
-                WeeklyTheme.active.is_(True),
-                WeeklyTheme.rotation_month == rotation_month,
-                or_(
-                    WeeklyTheme.day_of_week == str(weekday_index),
-                    WeeklyTheme.day_of_week == weekday_name,
-                ),
-            )
-            .limit(1)
-        )
-        result = await session.execute(statement)
-        return result.scalar_one_or_none()
-
-    def _build_resolved_theme(
-        self,
-        *,
-        source: str,
-        plan_date: date,
-        theme_name: str,
-        tone_funny_pct: int,
-        tone_emotion_pct: int,
-        prompt_keywords: list[str] | None,
-        color_palette: list[str] | None,
-        visual_style: str | None,
-        instagram_hashtags: list[str] | None,
-        override_id: int | None,
-        weekly_theme_id: int | None,
-    ) -> dict[str, Any]:
-        """Normalize a selected source into a single internal payload."""
-
-        return {
-            "theme_name": theme_name,
-            "source": source,
-            "tone_funny_pct": tone_funny_pct,
-            "tone_emotion_pct": tone_emotion_pct,
-            "prompt_keywords": list(prompt_keywords or []),
-            "color_palette": list(color_palette or []),
-            "visual_style": visual_style or "",
-            "instagram_hashtags": list(instagram_hashtags or []),
-            "plan_date": plan_date,
-            "override_id": override_id,
-            "weekly_theme_id": weekly_theme_id,
-        }
-
-    async def _upsert_daily_plan(
-        self,
-        *,
-        session: AsyncSession,
-        resolved: dict[str, Any],
-    ) -> None:
-        """Insert or update the daily plan row so repeated runs stay idempotent."""
-
-        statement = insert(DailyContentPlan).values(
-            plan_date=resolved["plan_date"],
-            theme_name=resolved["theme_name"],
-            source=resolved["source"],
-            override_id=resolved["override_id"],
-            weekly_theme_id=resolved["weekly_theme_id"],
-            tone_funny_pct=resolved["tone_funny_pct"],
-            tone_emotion_pct=resolved["tone_emotion_pct"],
-            prompt_keywords=resolved["prompt_keywords"],
-            color_palette=resolved["color_palette"],
-            status="resolved",
-        )
-        statement = statement.on_conflict_do_update(
-            index_elements=[DailyContentPlan.plan_date],
-            set_={
-                "theme_name": resolved["theme_name"],
-                "source": resolved["source"],
-                "override_id": resolved["override_id"],
-                "weekly_theme_id": resolved["weekly_theme_id"],
-                "tone_funny_pct": resolved["tone_funny_pct"],
-                "tone_emotion_pct": resolved["tone_emotion_pct"],
-                "prompt_keywords": resolved["prompt_keywords"],
-                "color_palette": resolved["color_palette"],
-                "status": "resolved",
+        """Resolve today's theme and upsert it into the daily content plan table.
+
+        The upsert runs inside the caller's transaction; callers own the unit of
+        work and must commit the session for the daily plan row to persist. The
+        resolution is only cached for later calls once that commit succeeds.
+        """
+
+        today = self._get_now().date()
+        entry = self._cache.get(today)
+        if entry is not None and entry[0] > time.monotonic():
+            return deepcopy(entry[1])
+
+        resolved = await self._resolve_for_date(session=session, today=today)
+        # Cached by the after_commit listener below, so a rolled-back upsert
+        # is never served as today's plan.
+        session.info[PENDING_THEME_KEY] = (today, deepcopy(resolved))
+        return resolved
+
+    @classmethod
+    def _store(cls, today: date, resolved: dict[str, Any]) -> None:
+        """Cache one committed resolution, replacing entries for earlier days."""
+
+        cls._cache.clear()
+        cls._cache[today] = (time.monotonic() + THEME_CACHE_TTL_SECONDS, resolved)
+
+    async def _resolve_for_date(self, *, session: AsyncSession, today: date) -> dict[str, Any]:
+        """Select the winning theme source for one date and persist the daily plan."""
+
+        # Same values as get_rotation_month/get_weekday_name, read inline.
+        result = await session.execute(
+            RESOLVE_TODAY_STATEMENT,
+            {
+                "plan_date": today,
+                "rotation_month": ROTATION_BY_MONTH[today.month],
+                "weekday_name": WEEKDAY_NAMES[today.weekday()],
             },
         )
-        await session.execute(statement)
-        await session.commit()
+        row = result.mappings().one()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("theme.resolved source=%s date=%s", row["source"], today)
+        return self._to_response(resolved=row, plan_date=today)
+
+    def _to_response(self, *, resolved: Mapping[str, Any], plan_date: date) -> dict[str, Any]:
+        """Return the exact public response contract required by callers.
 
-    def _to_response(self, *, resolved: dict[str, Any]) -> dict[str, Any]:
-        """Return the exact public response contract required by callers."""
+        List values are passed through by reference: the driver hands back fresh
+        lists per row, and ``resolve_today`` deep-copies what it caches and serves.
+        """
 
         return {
             "theme_name": resolved["theme_name"],
             "source": resolved["source"],
             "tone_funny_pct": resolved["tone_funny_pct"],
             "tone_emotion_pct": resolved["tone_emotion_pct"],
-            "prompt_keywords": list(resolved["prompt_keywords"]),
-            "color_palette": list(resolved["color_palette"]),
+            "prompt_keywords": resolved["prompt_keywords"],
+            "color_palette": resolved["color_palette"],
             "visual_style": resolved["visual_style"],
-            "instagram_hashtags": list(resolved["instagram_hashtags"]),
-            "plan_date": resolved["plan_date"].isoformat(),
+            "instagram_hashtags": resolved["instagram_hashtags"],
+            "plan_date": plan_date.isoformat(),
         }
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_committed_theme(session: Session) -> None:
+    """Promote a resolution to the shared cache once its daily plan upsert commits."""
+
+    pending = session.info.pop(PENDING_THEME_KEY, None)
+    if pending is not None:
+        ThemeResolver._store(*pending)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_theme(session: Session, previous_transaction) -> None:
+    """Forget a pending resolution whose upsert was rolled back."""
+
+    session.info.pop(PENDING_THEME_KEY, None)
@@ -0,0 +1 @@
+"""Alembic environment and the helpers shared by its revision scripts."""
@@ -0,0 +1,35 @@
+"""Bulk-load helpers shared by the seed migrations."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.util import await_only
+
+
+def copy_rows(table: sa.TableClause, rows: Sequence[Mapping[str, Any]], *, schema: str) -> None:
+    """Insert seed rows with COPY on asyncpg, falling back to ``op.bulk_insert``.
+
+    COPY runs on the migration's own driver connection, so it shares the
+    upgrade transaction. Offline ``--sql`` generation and other drivers keep
+    the portable multi-row INSERT.
+    """
+
+    context = op.get_context()
+    if context.as_sql or context.dialect.driver != "asyncpg":
+        op.bulk_insert(table, list(rows))
+        return
+
+    columns = [column.name for column in table.columns]
+    driver_connection = op.get_bind().connection.driver_connection
+    await_only(
+        driver_connection.copy_records_to_table(
+            table.name,
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns,
+            schema_name=schema,
+        )
+    )
@@ -34,9 +34,14 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 ASYNC_DATABASE_URL = get_async_database_url()
+IS_ASYNCPG = ASYNC_DATABASE_URL.startswith("postgresql+asyncpg://")
 config.set_main_option("sqlalchemy.url", ASYNC_DATABASE_URL)
 target_metadata = Base.metadata
 SCHEMA = settings.db_schema
+SAFE_SCHEMA = SCHEMA.replace('"', '""')
+# Opt-in for local/dev upgrades: skip the WAL flush on each migration commit.
+# A crash can only lose the newest commits whole, DDL and version row together.
+FAST_MIGRATE = os.environ.get("ECARD_FAST_MIGRATE") == "1"
 
 
 def do_run_migrations(connection: Connection) -> None:
@@ -48,6 +53,8 @@ def do_run_migrations(connection: Connection) -> None:
         compare_type=True,
     )
     with context.begin_transaction():
+        # Idempotent, transactional DDL: shares the migration run's single commit.
+        connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{SAFE_SCHEMA}"'))
         context.run_migrations()
 
 
@@ -56,8 +63,11 @@ async def run_migrations_online() -> None:
     section["sqlalchemy.url"] = ASYNC_DATABASE_URL
 
     connect_args: dict[str, Any] = {}
-    if ASYNC_DATABASE_URL.startswith("postgresql+asyncpg://"):
-        connect_args = {"server_settings": {"search_path": SCHEMA}}
+    if IS_ASYNCPG:
+        server_settings = {"search_path": SCHEMA}
+        if FAST_MIGRATE:
+            server_settings["synchronous_commit"] = "off"
+        connect_args = {"server_settings": server_settings}
 
     connectable = async_engine_from_config(
         section,
@@ -67,11 +77,6 @@ async def run_migrations_online() -> None:
     )
 
     async with connectable.connect() as connection:
-        # Always create schema first - idempotent, safe on every run
-        await connection.execute(
-            text(f'CREATE SCHEMA IF NOT EXISTS "{SCHEMA}"')
-        )
-        await connection.commit()
         # Run migrations exactly once
         await connection.run_sync(do_run_migrations)
 
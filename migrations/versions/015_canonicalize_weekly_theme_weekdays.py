@@ -0,0 +1,66 @@
+"""canonicalize weekly theme weekdays
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-03-02 00:00:15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "ecard_factory"
+
+WEEKDAY_NAMES_SQL = (
+    "(ARRAY['monday','tuesday','wednesday','thursday','friday','saturday','sunday'])"
+    "[weekly.day_of_week::integer + 1]"
+)
+
+
+def upgrade() -> None:
+    """Store weekdays only as lowercase names and index the active weekly lookup."""
+
+    # Rows that already have a name-keyed twin for the same rotation are left
+    # untouched so the (rotation_month, day_of_week) unique constraint holds.
+    op.execute(
+        f"""
+        UPDATE {SCHEMA}.weekly_themes AS weekly
+        SET day_of_week = {WEEKDAY_NAMES_SQL}
+        WHERE weekly.day_of_week ~ '^[0-6]$'
+          AND NOT EXISTS (
+              SELECT 1
+              FROM {SCHEMA}.weekly_themes AS named
+              WHERE named.rotation_month = weekly.rotation_month
+                AND named.day_of_week = {WEEKDAY_NAMES_SQL}
+          )
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_weekly_themes_active_lookup",
+            "weekly_themes",
+            ["rotation_month", "day_of_week"],
+            unique=False,
+            schema=SCHEMA,
+            postgresql_where=sa.text("active"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the partial lookup index; weekday names are kept as the canonical form."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_weekly_themes_active_lookup",
+            table_name="weekly_themes",
+            schema=SCHEMA,
+            postgresql_concurrently=True,
+        )
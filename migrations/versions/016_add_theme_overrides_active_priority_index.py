@@ -0,0 +1,45 @@
+"""add theme overrides active priority index
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-03-02 00:00:16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "016"
+down_revision = "015"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "ecard_factory"
+
+
+def upgrade() -> None:
+    """Index active overrides by priority so the daily lookup is a top-1 index scan."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_theme_overrides_active_priority",
+            "theme_overrides",
+            [sa.text("priority DESC"), "start_date", "end_date"],
+            unique=False,
+            schema=SCHEMA,
+            postgresql_where=sa.text("active"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the active override priority index."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_theme_overrides_active_priority",
+            table_name="theme_overrides",
+            schema=SCHEMA,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,51 @@
+"""add visual fields to daily content plan
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-03-02 00:00:17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "017"
+down_revision = "016"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "ecard_factory"
+
+
+def upgrade() -> None:
+    """Store the resolved visual style and hashtags on each daily plan row."""
+
+    op.add_column(
+        "daily_content_plan",
+        sa.Column(
+            "visual_style",
+            sa.String(length=100),
+            nullable=False,
+            server_default=sa.text("''"),
+        ),
+        schema=SCHEMA,
+    )
+    op.add_column(
+        "daily_content_plan",
+        sa.Column(
+            "instagram_hashtags",
+            postgresql.ARRAY(sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::text[]"),
+        ),
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    """Remove the denormalized visual fields from daily plans."""
+
+    op.drop_column("daily_content_plan", "instagram_hashtags", schema=SCHEMA)
+    op.drop_column("daily_content_plan", "visual_style", schema=SCHEMA)
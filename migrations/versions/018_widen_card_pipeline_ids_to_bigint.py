@@ -0,0 +1,55 @@
+"""widen card pipeline ids to bigint
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-03-02 00:00:18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "018"
+down_revision = "017"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "ecard_factory"
+
+# Append-heavy tables whose serial ids could outgrow int4.
+BIGINT_ID_TABLES = ("cards", "listings", "sales", "social_posts", "alerts")
+# (table, column) foreign keys that point at a widened id.
+BIGINT_FK_COLUMNS = (
+    ("listings", "card_id"),
+    ("social_posts", "card_id"),
+    ("watermarks", "card_id"),
+    ("alerts", "card_id"),
+    ("sales", "listing_id"),
+)
+
+
+def _set_id_type(new_type: sa.types.TypeEngine, old_type: sa.types.TypeEngine, sequence_type: str) -> None:
+    """Retype the widened ids, their serial sequences, and the referencing columns."""
+
+    for table_name in BIGINT_ID_TABLES:
+        op.alter_column(table_name, "id", type_=new_type, existing_type=old_type, schema=SCHEMA)
+        op.execute(f"ALTER SEQUENCE {SCHEMA}.{table_name}_id_seq AS {sequence_type}")
+    for table_name, column_name in BIGINT_FK_COLUMNS:
+        op.alter_column(table_name, column_name, type_=new_type, existing_type=old_type, schema=SCHEMA)
+
+
+def upgrade() -> None:
+    """Widen fact-table ids and their foreign keys to bigint and pad watermark pages."""
+
+    _set_id_type(sa.BigInteger(), sa.Integer(), "bigint")
+    # Watermarks get invisible_wm_id filled in after registration; leave room
+    # for HOT updates instead of splitting full pages.
+    op.execute(f"ALTER TABLE {SCHEMA}.watermarks SET (fillfactor = 90)")
+
+
+def downgrade() -> None:
+    """Restore integer ids and the default watermark fillfactor."""
+
+    op.execute(f"ALTER TABLE {SCHEMA}.watermarks RESET (fillfactor)")
+    _set_id_type(sa.Integer(), sa.BigInteger(), "integer")
@@ -0,0 +1,85 @@
+"""add covering card lookup indexes
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-03-02 00:00:19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "ecard_factory"
+
+
+def upgrade() -> None:
+    """Replace the plain card_id indexes with covering ones for index-only scans."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_listings_card_id_cover",
+            "listings",
+            ["card_id", "bundle_id"],
+            unique=False,
+            schema=SCHEMA,
+            postgresql_include=["price", "listed_at"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_social_posts_card_id_cover",
+            "social_posts",
+            ["card_id"],
+            unique=False,
+            schema=SCHEMA,
+            postgresql_include=["reach", "engagement", "link_clicks"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_listings_card_id", table_name="listings", schema=SCHEMA, postgresql_concurrently=True)
+        op.drop_index("ix_social_posts_card_id", table_name="social_posts", schema=SCHEMA, postgresql_concurrently=True)
+
+    # Index-only scans need an up-to-date visibility map; vacuum these small,
+    # frequently updated tables sooner than the 20% default.
+    op.execute(f"ALTER TABLE {SCHEMA}.listings SET (autovacuum_vacuum_scale_factor = 0.02)")
+    op.execute(f"ALTER TABLE {SCHEMA}.social_posts SET (autovacuum_vacuum_scale_factor = 0.02)")
+
+
+def downgrade() -> None:
+    """Restore the plain card_id indexes and default autovacuum settings."""
+
+    op.execute(f"ALTER TABLE {SCHEMA}.social_posts RESET (autovacuum_vacuum_scale_factor)")
+    op.execute(f"ALTER TABLE {SCHEMA}.listings RESET (autovacuum_vacuum_scale_factor)")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_social_posts_card_id",
+            "social_posts",
+            ["card_id"],
+            unique=False,
+            schema=SCHEMA,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_listings_card_id",
+            "listings",
+            ["card_id"],
+            unique=False,
+            schema=SCHEMA,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_social_posts_card_id_cover",
+            table_name="social_posts",
+            schema=SCHEMA,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_listings_card_id_cover",
+            table_name="listings",
+            schema=SCHEMA,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,50 @@
+"""add brin timestamp indexes
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-03-02 00:00:20
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "020"
+down_revision = "019"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "ecard_factory"
+
+# (index name, table, append-ordered timestamp column)
+BRIN_INDEXES = (
+    ("ix_cards_created_at_brin", "cards", "created_at"),
+    ("ix_sales_sale_date_brin", "sales", "sale_date"),
+    ("ix_social_posts_posted_at_brin", "social_posts", "posted_at"),
+    ("ix_alerts_created_at_brin", "alerts", "created_at"),
+)
+
+
+def upgrade() -> None:
+    """Index append-ordered timestamps with BRIN so date-range reports prune pages."""
+
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column_name in BRIN_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [column_name],
+                unique=False,
+                schema=SCHEMA,
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 128},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop the BRIN timestamp indexes."""
+
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _column_name in reversed(BRIN_INDEXES):
+            op.drop_index(index_name, table_name=table_name, schema=SCHEMA, postgresql_concurrently=True)
@@ -0,0 +1,60 @@
+"""generate sales net amount
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-03-02 00:00:21
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "021"
+down_revision = "020"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "ecard_factory"
+
+
+def upgrade() -> None:
+    """Derive sales.net_amount in Postgres and guard the fee against the gross amount."""
+
+    op.drop_column("sales", "net_amount", schema=SCHEMA)
+    op.add_column(
+        "sales",
+        sa.Column(
+            "net_amount",
+            sa.Numeric(precision=8, scale=2),
+            sa.Computed("gross_amount - platform_fee", persisted=True),
+            nullable=False,
+        ),
+        schema=SCHEMA,
+    )
+    op.create_check_constraint(
+        op.f("ck_sales_platform_fee_within_gross"),
+        "sales",
+        "platform_fee >= 0 AND gross_amount >= platform_fee",
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    """Restore net_amount as a plain stored column populated from the current values."""
+
+    op.drop_constraint(op.f("ck_sales_platform_fee_within_gross"), "sales", type_="check", schema=SCHEMA)
+    op.add_column(
+        "sales",
+        sa.Column("net_amount_plain", sa.Numeric(precision=8, scale=2), nullable=True),
+        schema=SCHEMA,
+    )
+    op.execute(f"UPDATE {SCHEMA}.sales SET net_amount_plain = net_amount")
+    op.drop_column("sales", "net_amount", schema=SCHEMA)
+    op.alter_column(
+        "sales",
+        "net_amount_plain",
+        new_column_name="net_amount",
+        nullable=False,
+        schema=SCHEMA,
+    )
@@ -0,0 +1,32 @@
+"""analyze rewritten card pipeline tables
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-03-02 00:00:22
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "022"
+down_revision = "021"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "ecard_factory"
+
+# Tables whose columns were retyped or regenerated by 018 and 021; ALTER
+# COLUMN TYPE discards the column's planner statistics.
+ANALYZED_TABLES = ("cards", "listings", "sales", "social_posts", "watermarks", "alerts")
+
+
+def upgrade() -> None:
+    """Refresh planner statistics so the first queries after upgrade plan on real counts."""
+
+    for table_name in ANALYZED_TABLES:
+        op.execute(f"ANALYZE {SCHEMA}.{table_name}")
+
+
+def downgrade() -> None:
+    """Statistics are not versioned; nothing to undo."""
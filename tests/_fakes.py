@@ -0,0 +1,52 @@
+"""Shared async HTTP and database stand-ins for the service unit tests."""
+
+from __future__ import annotations
+
+
+class FakeResponse:
+    """Minimal httpx response stub covering JSON APIs and binary downloads."""
+
+    def __init__(self, *, status_code=200, json_data=None, content=b"", headers=None):
+        self.status_code = status_code
+        self._json_data = json_data if json_data is not None else {}
+        self.content = content
+        self.headers = headers or {}
+
+    def json(self):
+        return self._json_data
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError("HTTP error")
+
+
+class BaseFakeAsyncClient:
+    """Async context-manager shell for httpx client stubs; subclasses add get/post."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeSession:
+    """Async session stub that serves one in-memory card and records commits."""
+
+    def __init__(self, card):
+        self.card = card
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def get(self, model, card_id):
+        if self.card is not None and self.card.id == card_id:
+            return self.card
+        return None
+
+    async def commit(self):
+        self.committed = True
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+from functools import cache
+import hashlib
+import json
 import os
 from pathlib import Path
+import time
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
-INTEGRATION_DIR = Path(__file__).resolve().parent
+# Bump when recorded Groq responses should be discarded even though the
+# request payloads (model, prompts, temperature) have not changed.
+GROQ_CACHE_VERSION = "v1"
+# Groq's free tier allows 30 chat completions per minute per key.
+GROQ_REQUESTS_PER_MINUTE = 30
+
+# Unresolved on purpose: pytest imports this conftest from the same collection
+# path it reports in item.path, so the two compare without a realpath per item.
+INTEGRATION_DIR = Path(__file__).parent
 
 
 def _env_flag(name: str, default: str = "false") -> bool:
@@ -23,38 +37,143 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
 
     enabled = _env_flag("INTEGRATION_TESTS", "false")
     skip_marker = pytest.mark.skip(reason="Integration tests disabled. Set INTEGRATION_TESTS=true to run.")
+    integration_marker = pytest.mark.integration
 
     for item in items:
-        item_path = Path(str(item.path)).resolve()
-        if not item_path.is_relative_to(INTEGRATION_DIR):
+        if not item.path.is_relative_to(INTEGRATION_DIR):
             continue
 
-        item.add_marker(pytest.mark.integration)
+        item.add_marker(integration_marker)
         if not enabled:
             item.add_marker(skip_marker)
 
 
-@pytest_asyncio.fixture
-async def real_db_session() -> AsyncSession:
-    """Yield a real async database session using the configured Railway URL."""
+# Built once; each test binds it to its own transaction-scoped connection.
+_SESSION_FACTORY = async_sessionmaker(
+    class_=AsyncSession,
+    expire_on_commit=False,
+    join_transaction_mode="create_savepoint",
+)
+
+
+@cache
+def _async_database_url() -> str:
+    """Return the configured Railway or local database URL for the asyncpg driver."""
 
     from app.config import settings
 
-    database_url = settings.railway_database_url or settings.database_url
-    async_url = database_url
+    async_url = settings.railway_database_url or settings.database_url
     if async_url.startswith("postgresql://"):
         async_url = async_url.replace("postgresql://", "postgresql+asyncpg://", 1)
     elif async_url.startswith("postgres://"):
         async_url = async_url.replace("postgres://", "postgresql+asyncpg://", 1)
+    return async_url
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _engine() -> AsyncIterator[AsyncEngine]:
+    """Create one async engine for the whole integration run and dispose it at the end."""
+
+    from app.config import settings
 
     engine = create_async_engine(
-        async_url,
+        _async_database_url(),
         connect_args={"server_settings": {"search_path": settings.db_schema}},
         pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=0,
     )
-    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    yield engine
+    await engine.dispose()
 
-    async with session_factory() as session:
-        yield session
 
-    await engine.dispose()
+@pytest_asyncio.fixture(loop_scope="session")
+async def real_db_session(_engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    """Yield a session inside an outer transaction that is rolled back after each test.
+
+    Test commits release savepoints instead of committing, so nothing a test
+    writes outlives it.
+    """
+
+    async with _engine.connect() as connection:
+        transaction = await connection.begin()
+        session = _SESSION_FACTORY(bind=connection)
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def todays_theme(_engine: AsyncEngine) -> dict:
+    """Resolve today's theme once per module on its own rolled-back transaction."""
+
+    from app.services.theme_resolver import ThemeResolver
+
+    async with _engine.connect() as connection:
+        transaction = await connection.begin()
+        session = _SESSION_FACTORY(bind=connection)
+        try:
+            return await ThemeResolver().resolve_today(session)
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+class _RateLimiter:
+    """Token bucket that spaces live requests out instead of letting them hit 429s."""
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self.capacity = float(requests_per_minute)
+        self.refill_per_second = requests_per_minute / 60.0
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_per_second)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.refill_per_second)
+
+
+# Shared by every test in the run, since the Groq quota is per key, not per test.
+_GROQ_LIMITER = _RateLimiter(GROQ_REQUESTS_PER_MINUTE)
+
+
+@pytest.fixture
+def groq_cache(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Replay recorded Groq chat completions from the pytest cache directory.
+
+    Responses are keyed by a hash of the full request payload, so a prompt or
+    model change records afresh. Set GROQ_RECORD=true to refresh every entry.
+    Live calls go through a run-wide rate limiter.
+    """
+
+    from app.services.groq_service import GroqService
+
+    cache_dir = request.config.cache.mkdir("groq")
+    record = _env_flag("GROQ_RECORD", "false")
+    live_chat_completion = GroqService._chat_completion
+
+    async def cached_chat_completion(self: GroqService, payload: dict) -> str:
+        digest = hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+        entry = cache_dir / f"{GROQ_CACHE_VERSION}-{digest}.json"
+        if not record and entry.exists():
+            return json.loads(entry.read_text(encoding="utf-8"))["content"]
+
+        await _GROQ_LIMITER.acquire()
+        content = await live_chat_completion(self, payload)
+        entry.write_text(json.dumps({"content": content}), encoding="utf-8")
+        return content
+
+    monkeypatch.setattr(GroqService, "_chat_completion", cached_chat_completion)
+    return cache_dir
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 
 import httpx
@@ -9,15 +10,29 @@ import pytest
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_theme_resolver_hits_real_db(real_db_session):
-    """Theme resolution should return a real persisted theme from the configured database."""
+    """Theme resolution should return a real theme and persist today's plan row on commit."""
 
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.models.daily_plan import DailyContentPlan
     from app.services.theme_resolver import KOLKATA_TZ, ThemeResolver
 
-    resolver = ThemeResolver()
-    resolved = await resolver.resolve_today(real_db_session)
-    today = datetime.now(KOLKATA_TZ).date().isoformat()
+    ThemeResolver.invalidate()
+    resolved = await ThemeResolver().resolve_today(real_db_session)
+    await real_db_session.commit()
+    plan_date = datetime.now(KOLKATA_TZ).date()
+    today = plan_date.isoformat()
+
+    # Read back through a fresh session on the test connection, so the plan
+    # row must have been written and committed rather than served from memory.
+    async with AsyncSession(bind=real_db_session.bind) as reader:
+        plan = (
+            await reader.execute(select(DailyContentPlan).where(DailyContentPlan.plan_date == plan_date))
+        ).scalar_one()
+    assert plan.theme_name == resolved["theme_name"]
+    assert plan.source == resolved["source"]
 
     assert set(resolved.keys()) == {
         "theme_name",
@@ -37,8 +52,7 @@ async def test_theme_resolver_hits_real_db(real_db_session):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_groq_generates_real_phrases():
+async def test_groq_generates_real_phrases(groq_cache):
     """Groq should return three live phrase candidates for a simple theme input."""
 
     from app.services.groq_service import GroqService
@@ -62,8 +76,7 @@ async def test_groq_generates_real_phrases():
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_groq_generates_real_dalle_prompt():
+async def test_groq_generates_real_dalle_prompt(groq_cache):
     """Groq should produce a real DALL-E prompt that stays within the configured limit."""
 
     from app.services.groq_service import GroqService
@@ -83,7 +96,6 @@ async def test_groq_generates_real_dalle_prompt():
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_health_endpoint_hits_real_db():
     """The local health endpoint should be reachable while uvicorn is running."""
 
@@ -96,80 +108,81 @@ async def test_health_endpoint_hits_real_db():
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_full_card_pipeline_dry_run(real_db_session):
+async def test_full_card_pipeline_dry_run(real_db_session, todays_theme, groq_cache, monkeypatch):
     """Exercise the full dry-run pipeline with live DB and Groq but no paid DALL-E call."""
 
+    from PIL import Image
+
     from app.models.card import Card
     from app.services.groq_service import GroqService
     from app.services.pillow_service import PillowService
-    from app.services.theme_resolver import ThemeResolver
 
-    resolver = ThemeResolver()
     groq = GroqService()
     pillow = PillowService()
-    card = None
 
-    try:
-        resolved = await resolver.resolve_today(real_db_session)
+    async def fake_download_image(image_url: str):
+        # Stand in for the DALL-E image locally; noise keeps the JPEG realistically sized.
+        return Image.effect_noise((1024, 1024), 64).convert("RGBA")
 
-        card = Card(
-            phrase="Temporary phrase placeholder",
-            theme_name=resolved["theme_name"],
-            theme_source=resolved["source"],
-            event_id=None,
-            status="pending_phrase_approval",
-        )
-        real_db_session.add(card)
-        await real_db_session.commit()
-        await real_db_session.refresh(card)
-
-        phrases = await groq.generate_phrases(
-            theme_name=resolved["theme_name"],
-            tone_funny_pct=resolved["tone_funny_pct"],
-            tone_emotion_pct=resolved["tone_emotion_pct"],
-            prompt_keywords=resolved["prompt_keywords"],
-            visual_style=resolved["visual_style"],
-            count=3,
-        )
-        best_phrase = await groq.select_best_phrase(
-            phrases=phrases,
-            theme_name=resolved["theme_name"],
-            tone_funny_pct=resolved["tone_funny_pct"],
-            tone_emotion_pct=resolved["tone_emotion_pct"],
-        )
-        dalle_prompt = await groq.generate_dalle_prompt(
+    monkeypatch.setattr(pillow, "_download_image", fake_download_image)
+
+    resolved = todays_theme
+
+    card = Card(
+        phrase="Temporary phrase placeholder",
+        theme_name=resolved["theme_name"],
+        theme_source=resolved["source"],
+        event_id=None,
+        status="pending_phrase_approval",
+    )
+    real_db_session.add(card)
+    # Flushing assigns the id without ending the test transaction, which
+    # real_db_session rolls back afterwards, so no cleanup delete is needed.
+    await real_db_session.flush()
+
+    phrases = await groq.generate_phrases(
+        theme_name=resolved["theme_name"],
+        tone_funny_pct=resolved["tone_funny_pct"],
+        tone_emotion_pct=resolved["tone_emotion_pct"],
+        prompt_keywords=resolved["prompt_keywords"],
+        visual_style=resolved["visual_style"],
+        count=3,
+    )
+    best_phrase = await groq.select_best_phrase(
+        phrases=phrases,
+        theme_name=resolved["theme_name"],
+        tone_funny_pct=resolved["tone_funny_pct"],
+        tone_emotion_pct=resolved["tone_emotion_pct"],
+    )
+    # The preview only needs the chosen phrase, so it renders alongside
+    # the Groq prompt round trip instead of waiting behind it.
+    dalle_prompt, preview_bytes = await asyncio.gather(
+        groq.generate_dalle_prompt(
             phrase=best_phrase["text"],
             theme_name=resolved["theme_name"],
             color_palette=resolved["color_palette"],
             visual_style=resolved["visual_style"],
             prompt_keywords=resolved["prompt_keywords"],
-        )
-
-        preview_bytes = await pillow.create_preview(
-            image_url="https://picsum.photos/1024/1024",
+        ),
+        pillow.create_preview(
+            image_url="local://sample-1024",
             phrase=best_phrase["text"],
             color_palette=resolved["color_palette"],
-        )
-
-        card.phrase = str(best_phrase["text"])
-        card.dalle_prompt = dalle_prompt
-        card.status = "phrase_approved"
-        await real_db_session.commit()
-
-        stored_card = await real_db_session.get(Card, card.id)
-
-        assert phrases
-        assert best_phrase["text"]
-        assert dalle_prompt
-        assert preview_bytes.startswith(b"\xff\xd8")
-        assert len(preview_bytes) > 10 * 1024
-        assert stored_card is not None
-        assert stored_card.status == "phrase_approved"
-        assert stored_card.phrase == best_phrase["text"]
-    finally:
-        if card is not None and card.id is not None:
-            stored = await real_db_session.get(Card, card.id)
-            if stored is not None:
-                await real_db_session.delete(stored)
-                await real_db_session.commit()
+        ),
+    )
+
+    card.phrase = str(best_phrase["text"])
+    card.dalle_prompt = dalle_prompt
+    card.status = "phrase_approved"
+    await real_db_session.flush()
+
+    stored_card = await real_db_session.get(Card, card.id)
+
+    assert phrases
+    assert best_phrase["text"]
+    assert dalle_prompt
+    assert preview_bytes.startswith(b"\xff\xd8")
+    assert len(preview_bytes) > 10 * 1024
+    assert stored_card is not None
+    assert stored_card.status == "phrase_approved"
+    assert stored_card.phrase == best_phrase["text"]
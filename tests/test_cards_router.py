@@ -4,44 +4,40 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from decimal import Decimal
-import importlib
-import sys
 
-from fastapi.testclient import TestClient
+import pytest
 
+DEFAULT_LLM_COST = Decimal("0.0000")
+DEFAULT_IMAGE_COST = Decimal("0.0400")
 
-def reload_app_modules():
-    """Reload the main app and cards router so test env overrides are applied cleanly."""
 
-    for module_name in list(sys.modules):
-        if (
-            module_name in {"app.config", "app.database", "app.main"}
-            or module_name.startswith("app.models")
-            or module_name.startswith("app.routers")
-            or module_name.startswith("app.schemas")
-        ):
-            sys.modules.pop(module_name, None)
+@pytest.fixture
+def cards_app(shared_app):
+    """Return the shared app, cards router, card model module, and client; clear overrides afterwards."""
 
-    main_module = importlib.import_module("app.main")
-    cards_module = importlib.import_module("app.routers.cards")
-    return main_module, cards_module
+    modules, client = shared_app
+    app = modules["app.main"].app
+    try:
+        yield app, modules["app.routers.cards"], modules["app.models.card"], client
+    finally:
+        app.dependency_overrides.clear()
 
 
 class FakeScalarsResult:
     """Minimal scalar result wrapper for select(Card) responses."""
 
-    def __init__(self, items):
-        self.items = list(items)
+    def __init__(self, items: list):
+        self.items = items
 
     def all(self):
-        return list(self.items)
+        return self.items
 
 
 class FakeExecuteResult:
     """Minimal execute result wrapper that exposes scalars()."""
 
-    def __init__(self, items):
-        self.items = list(items)
+    def __init__(self, items: list):
+        self.items = items
 
     def scalars(self) -> FakeScalarsResult:
         return FakeScalarsResult(self.items)
@@ -68,9 +64,9 @@ class FakeCardSession:
         if getattr(card, "created_at", None) is None:
             card.created_at = datetime(2026, 2, 28, 8, 30, tzinfo=timezone.utc)
         if getattr(card, "cost_llm", None) is None:
-            card.cost_llm = Decimal("0.0000")
+            card.cost_llm = DEFAULT_LLM_COST
         if getattr(card, "cost_image", None) is None:
-            card.cost_image = Decimal("0.0400")
+            card.cost_image = DEFAULT_IMAGE_COST
         self.cards[card.id] = card
         self.pending_add = None
 
@@ -99,40 +95,36 @@ def make_card(card_model, *, card_id: int, status: str, image_url: str | None =
         canva_url=None,
         final_png_url=None,
         status=status,
-        cost_llm=Decimal("0.0000"),
-        cost_image=Decimal("0.0400"),
+        cost_llm=DEFAULT_LLM_COST,
+        cost_image=DEFAULT_IMAGE_COST,
         created_at=datetime(2026, 2, 28, 8, card_id, tzinfo=timezone.utc),
     )
 
 
 def test_post_cards_create_returns_201_with_card_id(
     configured_env: dict[str, str],
+    cards_app,
 ) -> None:
     """Card creation should persist a new row and return its generated identity."""
 
-    main_module, cards_module = reload_app_modules()
-    card_model = importlib.import_module("app.models.card")
+    app, cards_module, card_model, client = cards_app
     session = FakeCardSession()
 
     async def override_get_db():
         yield session
 
-    main_module.app.dependency_overrides[cards_module.get_db] = override_get_db
-
-    try:
-        with TestClient(main_module.app) as client:
-            response = client.post(
-                "/cards/create",
-                json={
-                    "phrase": "Warm wishes for your day",
-                    "theme_name": "Festival Glow",
-                    "theme_source": "weekly",
-                    "event_id": 7,
-                    "dalle_prompt": "festive illustration",
-                },
-            )
-    finally:
-        main_module.app.dependency_overrides.clear()
+    app.dependency_overrides[cards_module.get_db] = override_get_db
+
+    response = client.post(
+        "/cards/create",
+        json={
+            "phrase": "Warm wishes for your day",
+            "theme_name": "Festival Glow",
+            "theme_source": "weekly",
+            "event_id": 7,
+            "dalle_prompt": "festive illustration",
+        },
+    )
 
     assert response.status_code == 201
     assert response.json()["card_id"] == 1
@@ -143,11 +135,11 @@ def test_post_cards_create_returns_201_with_card_id(
 
 def test_patch_cards_status_updates_correctly(
     configured_env: dict[str, str],
+    cards_app,
 ) -> None:
     """Status updates should mutate the stored card and return the new value."""
 
-    main_module, cards_module = reload_app_modules()
-    card_model = importlib.import_module("app.models.card")
+    app, cards_module, card_model, client = cards_app
     session = FakeCardSession(
         [make_card(card_model, card_id=1, status="pending_phrase_approval")]
     )
@@ -155,13 +147,9 @@ def test_patch_cards_status_updates_correctly(
     async def override_get_db():
         yield session
 
-    main_module.app.dependency_overrides[cards_module.get_db] = override_get_db
+    app.dependency_overrides[cards_module.get_db] = override_get_db
 
-    try:
-        with TestClient(main_module.app) as client:
-            response = client.patch("/cards/1/status", json={"status": "phrase_approved"})
-    finally:
-        main_module.app.dependency_overrides.clear()
+    response = client.patch("/cards/1/status", json={"status": "phrase_approved"})
 
     assert response.status_code == 200
     assert response.json() == {"card_id": 1, "status": "phrase_approved"}
@@ -170,11 +158,11 @@ def test_patch_cards_status_updates_correctly(
 
 def test_patch_cards_urls_updates_correctly(
     configured_env: dict[str, str],
+    cards_app,
 ) -> None:
     """URL updates should persist the provided fields and report what changed."""
 
-    main_module, cards_module = reload_app_modules()
-    card_model = importlib.import_module("app.models.card")
+    app, cards_module, card_model, client = cards_app
     session = FakeCardSession(
         [make_card(card_model, card_id=1, status="pending_image")]
     )
@@ -182,16 +170,12 @@ def test_patch_cards_urls_updates_correctly(
     async def override_get_db():
         yield session
 
-    main_module.app.dependency_overrides[cards_module.get_db] = override_get_db
+    app.dependency_overrides[cards_module.get_db] = override_get_db
 
-    try:
-        with TestClient(main_module.app) as client:
-            response = client.patch(
-                "/cards/1/urls",
-                json={"image_url": "https://cdn.example.com/final.png"},
-            )
-    finally:
-        main_module.app.dependency_overrides.clear()
+    response = client.patch(
+        "/cards/1/urls",
+        json={"image_url": "https://cdn.example.com/final.png"},
+    )
 
     assert response.status_code == 200
     assert response.json() == {"card_id": 1, "updated_fields": ["image_url"]}
@@ -200,11 +184,11 @@ def test_patch_cards_urls_updates_correctly(
 
 def test_get_cards_pending_returns_list(
     configured_env: dict[str, str],
+    cards_app,
 ) -> None:
     """Pending cards endpoint should return the cards still awaiting workflow steps."""
 
-    main_module, cards_module = reload_app_modules()
-    card_model = importlib.import_module("app.models.card")
+    app, cards_module, card_model, client = cards_app
     session = FakeCardSession(
         [
             make_card(card_model, card_id=1, status="pending_phrase_approval"),
@@ -216,13 +200,9 @@ def test_get_cards_pending_returns_list(
     async def override_get_db():
         yield session
 
-    main_module.app.dependency_overrides[cards_module.get_db] = override_get_db
+    app.dependency_overrides[cards_module.get_db] = override_get_db
 
-    try:
-        with TestClient(main_module.app) as client:
-            response = client.get("/cards/pending")
-    finally:
-        main_module.app.dependency_overrides.clear()
+    response = client.get("/cards/pending")
 
     assert response.status_code == 200
     payload = response.json()
@@ -233,11 +213,11 @@ def test_get_cards_pending_returns_list(
 
 def test_invalid_card_status_returns_422(
     configured_env: dict[str, str],
+    cards_app,
 ) -> None:
     """Unsupported workflow statuses should be rejected by request validation."""
 
-    main_module, cards_module = reload_app_modules()
-    card_model = importlib.import_module("app.models.card")
+    app, cards_module, card_model, client = cards_app
     session = FakeCardSession(
         [make_card(card_model, card_id=1, status="pending_phrase_approval")]
     )
@@ -245,12 +225,8 @@ def test_invalid_card_status_returns_422(
     async def override_get_db():
         yield session
 
-    main_module.app.dependency_overrides[cards_module.get_db] = override_get_db
+    app.dependency_overrides[cards_module.get_db] = override_get_db
 
-    try:
-        with TestClient(main_module.app) as client:
-            response = client.patch("/cards/1/status", json={"status": "not_a_real_status"})
-    finally:
-        main_module.app.dependency_overrides.clear()
+    response = client.patch("/cards/1/status", json={"status": "not_a_real_status"})
 
     assert response.status_code == 422
@@ -3,27 +3,25 @@
 from __future__ import annotations
 
 import importlib
-import sys
+from types import ModuleType
 
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from app.config import Settings
 
-def reload_config_and_database() -> tuple[object, object]:
-    """Reload config and database modules so each test sees fresh environment state."""
 
-    for module_name in list(sys.modules):
-        if module_name in {"app.config", "app.database"} or module_name.startswith("app.models"):
-            sys.modules.pop(module_name, None)
+def reload_settings() -> ModuleType:
+    """Drop the cached settings so the next lookup re-reads the environment."""
 
     config_module = importlib.import_module("app.config")
-    database_module = importlib.import_module("app.database")
-    return config_module, database_module
+    config_module.get_settings.cache_clear()
+    return config_module
 
 
 def test_settings_loads_from_environment(configured_env: dict[str, str]) -> None:
-    """The settings singleton should read values directly from the environment."""
+    """The cached settings instance should read values directly from the environment."""
 
-    config_module, _ = reload_config_and_database()
+    config_module = reload_settings()
     settings = config_module.settings
 
     assert settings.database_url == configured_env["DATABASE_URL"]
@@ -40,55 +38,46 @@ def test_settings_loads_from_environment(configured_env: dict[str, str]) -> None
     assert settings.db_schema == configured_env["DB_SCHEMA"]
 
 
-def test_active_db_url_uses_database_url_outside_production(
-    configured_env: dict[str, str],
-    monkeypatch,
-) -> None:
+def test_active_db_url_uses_database_url_outside_production(configured_env: dict[str, str]) -> None:
     """Non-production environments should always use DATABASE_URL."""
 
-    monkeypatch.setenv("APP_ENV", "development")
-    config_module, _ = reload_config_and_database()
+    settings = Settings(_env_file=None, APP_ENV="development")
 
-    assert config_module.settings.active_db_url == configured_env["DATABASE_URL"]
+    assert settings.active_db_url == configured_env["DATABASE_URL"]
 
 
-def test_active_db_url_uses_railway_url_in_production(
-    configured_env: dict[str, str],
-    monkeypatch,
-) -> None:
+def test_active_db_url_uses_railway_url_in_production(configured_env: dict[str, str]) -> None:
     """Production should prefer Railway's injected database URL when available."""
 
-    monkeypatch.setenv("APP_ENV", "production")
-    config_module, _ = reload_config_and_database()
+    settings = Settings(_env_file=None, APP_ENV="production")
 
-    assert config_module.settings.active_db_url == configured_env["RAILWAY_DATABASE_URL"]
+    assert settings.active_db_url == configured_env["RAILWAY_DATABASE_URL"]
 
 
 def test_active_db_url_falls_back_to_database_url_when_railway_is_missing(
     configured_env: dict[str, str],
-    monkeypatch,
 ) -> None:
     """Production should fall back cleanly when Railway does not inject a URL."""
 
-    monkeypatch.setenv("APP_ENV", "production")
-    monkeypatch.delenv("RAILWAY_DATABASE_URL", raising=False)
-    config_module, _ = reload_config_and_database()
+    settings = Settings(_env_file=None, APP_ENV="production", RAILWAY_DATABASE_URL=None)
 
-    assert config_module.settings.active_db_url == configured_env["DATABASE_URL"]
+    assert settings.active_db_url == configured_env["DATABASE_URL"]
 
 
 def test_database_engine_is_created_successfully(configured_env: dict[str, str]) -> None:
-    """Importing the database module should create an async engine without connecting."""
+    """Building the database engine should create an async engine without connecting."""
 
-    config_module, database_module = reload_config_and_database()
+    config_module = reload_settings()
+    database_module = importlib.import_module("app.database")
+    engine = database_module.build_engine()
     expected_async_url = configured_env["DATABASE_URL"].replace(
         "postgresql://",
         "postgresql+asyncpg://",
         1,
     )
 
-    assert isinstance(database_module.engine, AsyncEngine)
+    assert isinstance(engine, AsyncEngine)
     assert config_module.settings.active_db_url == configured_env["DATABASE_URL"]
     assert database_module.get_async_database_url() == expected_async_url
-    assert database_module.engine.sync_engine.url.render_as_string(hide_password=False) == expected_async_url
+    assert engine.sync_engine.url.render_as_string(hide_password=False) == expected_async_url
     assert database_module.Base.metadata.schema == configured_env["DB_SCHEMA"]
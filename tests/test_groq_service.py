@@ -2,54 +2,32 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
 import importlib
-import sys
 
 import pytest
 
+from tests._fakes import BaseFakeAsyncClient, FakeResponse
 
-def reload_groq_service_module():
-    """Reload the Groq service module so HTTP client monkeypatches do not leak."""
 
-    for module_name in list(sys.modules):
-        if module_name in {"app.config"} or module_name.startswith("app.services.groq_service"):
-            sys.modules.pop(module_name, None)
+@pytest.fixture
+def service_module(configured_env: dict[str, str]):
+    """Import the Groq service once; monkeypatch undoes per-test patches on it."""
 
     return importlib.import_module("app.services.groq_service")
 
 
-class FakeResponse:
-    """Minimal httpx response stub for Groq API tests."""
-
-    def __init__(self, payload):
-        self.payload = payload
-
-    def raise_for_status(self) -> None:
-        return None
-
-    def json(self):
-        return self.payload
-
-
-class FakeAsyncClient:
+class FakeAsyncClient(BaseFakeAsyncClient):
     """Async client stub that returns queued Groq API payloads."""
 
     responses: list[dict] = []
     posted_payloads: list[dict] = []
 
     def __init__(self, *args, **kwargs):
-        self.post = AsyncMock(side_effect=self._post)
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
+        """Accept and ignore the httpx.AsyncClient constructor arguments."""
 
-    async def _post(self, url, *, headers=None, json=None):
+    async def post(self, url, *, headers=None, json=None):
         self.__class__.posted_payloads.append({"url": url, "headers": headers, "json": json})
-        return FakeResponse(self.__class__.responses.pop(0))
+        return FakeResponse(json_data=self.__class__.responses.pop(0))
 
 
 def make_choice_payload(content: str) -> dict:
@@ -58,14 +36,13 @@ def make_choice_payload(content: str) -> dict:
     return {"choices": [{"message": {"content": content}}]}
 
 
-@pytest.mark.asyncio
 async def test_generate_phrases_returns_correct_count(
     configured_env: dict[str, str],
+    service_module,
     monkeypatch,
 ) -> None:
     """The service should return exactly the requested number of phrase dicts."""
 
-    service_module = reload_groq_service_module()
     FakeAsyncClient.responses = [
         make_choice_payload(
             """
@@ -94,14 +71,13 @@ async def test_generate_phrases_returns_correct_count(
     assert FakeAsyncClient.posted_payloads[0]["headers"]["Authorization"] == "Bearer test-groq-key"
 
 
-@pytest.mark.asyncio
 async def test_generate_phrases_parses_json_response_correctly(
     configured_env: dict[str, str],
+    service_module,
     monkeypatch,
 ) -> None:
     """Structured JSON content from Groq should be normalized without losing fields."""
 
-    service_module = reload_groq_service_module()
     FakeAsyncClient.responses = [
         make_choice_payload(
             '{"phrases": [{"text": "Wishing you joy, calm, and kindness in every moment today!", '
@@ -130,14 +106,13 @@ async def test_generate_phrases_parses_json_response_correctly(
     ]
 
 
-@pytest.mark.asyncio
 async def test_generate_phrases_falls_back_when_json_is_invalid(
     configured_env: dict[str, str],
+    service_module,
     monkeypatch,
 ) -> None:
     """Plain-text responses should still produce usable phrase dicts."""
 
-    service_module = reload_groq_service_module()
     FakeAsyncClient.responses = [
         make_choice_payload(
             """
@@ -165,10 +140,10 @@ async def test_generate_phrases_falls_back_when_json_is_invalid(
 
 def test_score_phrase_applies_all_rules(
     configured_env: dict[str, str],
+    service_module,
 ) -> None:
     """Phrase scoring should reflect the configured bonuses and penalties."""
 
-    service_module = reload_groq_service_module()
     service = service_module.GroqService()
 
     assert service._score_phrase(  # noqa: SLF001
@@ -209,13 +184,12 @@ def test_score_phrase_applies_all_rules(
     ) == -10
 
 
-@pytest.mark.asyncio
 async def test_select_best_phrase_returns_highest_scoring_candidate(
     configured_env: dict[str, str],
+    service_module,
 ) -> None:
     """The selection method should return the phrase with the strongest score."""
 
-    service_module = reload_groq_service_module()
     service = service_module.GroqService()
 
     best = await service.select_best_phrase(
@@ -241,14 +215,13 @@ async def test_select_best_phrase_returns_highest_scoring_candidate(
     assert best["text"].startswith("Could today bring louder laughs")
 
 
-@pytest.mark.asyncio
 async def test_generate_dalle_prompt_returns_string_under_900_chars(
     configured_env: dict[str, str],
+    service_module,
     monkeypatch,
 ) -> None:
     """Generated DALL-E prompts should be returned as constrained strings."""
 
-    service_module = reload_groq_service_module()
     FakeAsyncClient.responses = [
         make_choice_payload(
             "A cinematic festive courtyard at dusk with marigold garlands, warm lantern glow, "
@@ -0,0 +1,114 @@
+"""Unit tests for the bulk-load helper shared by the seed migrations."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+from types import SimpleNamespace
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.util import greenlet_spawn
+
+from migrations import _bulk
+
+ALEMBIC_INI = Path(__file__).resolve().parents[1] / "alembic.ini"
+SEED_REVISION_CHECK = f"""
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+scripts = ScriptDirectory.from_config(Config({str(ALEMBIC_INI)!r}))
+import migrations
+
+assert migrations.__file__ is not None
+for revision in ("011", "012"):
+    assert scripts.get_revision(revision).module.copy_rows.__module__ == "migrations._bulk"
+"""
+
+ROWS = [
+    {"id": 1, "name": "Diwali"},
+    {"id": 2, "name": "Holi"},
+]
+
+
+class FakeAsyncpgConnection:
+    """Record ``copy_records_to_table`` calls the way asyncpg receives them."""
+
+    def __init__(self) -> None:
+        self.copies: list[tuple[str, dict[str, object]]] = []
+
+    async def copy_records_to_table(self, table_name: str, **kwargs) -> str:
+        self.copies.append((table_name, kwargs))
+        return f"COPY {len(kwargs['records'])}"
+
+
+async def test_copy_rows_uses_copy_records_to_table_on_asyncpg(monkeypatch) -> None:
+    """On asyncpg the rows should be sent as column-ordered tuples through COPY."""
+
+    driver_connection = FakeAsyncpgConnection()
+
+    def bulk_insert(*args, **kwargs):
+        pytest.fail("asyncpg migrations should not fall back to bulk_insert")
+
+    monkeypatch.setattr(
+        _bulk,
+        "op",
+        SimpleNamespace(
+            get_context=lambda: SimpleNamespace(as_sql=False, dialect=SimpleNamespace(driver="asyncpg")),
+            get_bind=lambda: SimpleNamespace(connection=SimpleNamespace(driver_connection=driver_connection)),
+            bulk_insert=bulk_insert,
+        ),
+    )
+
+    table = sa.table("events", sa.column("id", sa.Integer), sa.column("name", sa.String))
+
+    await greenlet_spawn(_bulk.copy_rows, table, ROWS, schema="ecard_factory")
+
+    assert driver_connection.copies == [
+        (
+            "events",
+            {
+                "records": [(1, "Diwali"), (2, "Holi")],
+                "columns": ["id", "name"],
+                "schema_name": "ecard_factory",
+            },
+        )
+    ]
+
+
+def test_copy_rows_falls_back_to_bulk_insert_on_other_drivers() -> None:
+    """Non-asyncpg dialects should insert the same rows through ``op.bulk_insert``."""
+
+    metadata = sa.MetaData()
+    table = sa.Table("events", metadata, sa.Column("id", sa.Integer), sa.Column("name", sa.String))
+    engine = sa.create_engine("sqlite://")
+
+    with engine.begin() as connection:
+        metadata.create_all(connection)
+        with Operations.context(MigrationContext.configure(connection)):
+            _bulk.copy_rows(table, ROWS, schema="ecard_factory")
+
+        inserted = connection.execute(sa.select(table.c.id, table.c.name).order_by(table.c.id)).all()
+
+    assert [tuple(row) for row in inserted] == [(1, "Diwali"), (2, "Holi")]
+
+
+def test_seed_revisions_import_bulk_helper_from_any_working_directory(tmp_path: Path) -> None:
+    """Alembic should load the seed revisions and their ``migrations._bulk`` import outside the repo root."""
+
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONPATH"}
+
+    result = subprocess.run(
+        [sys.executable, "-c", SEED_REVISION_CHECK],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -5,138 +5,182 @@ from __future__ import annotations
 from datetime import date
 from decimal import Decimal
 import importlib
-import sys
 
+import pytest
 
-def reload_models_module():
-    """Reload database and model modules so tests use the current environment."""
 
-    for module_name in list(sys.modules):
-        if module_name in {"app.config", "app.database"} or module_name.startswith("app.models"):
-            sys.modules.pop(module_name, None)
+@pytest.fixture
+def models(configured_env: dict[str, str]):
+    """Import the ORM models under the test environment."""
 
     return importlib.import_module("app.models")
 
 
-def test_models_can_be_instantiated_and_represented(configured_env: dict[str, str]) -> None:
-    """Every ORM model should instantiate with required fields and return a repr string."""
+MODEL_CASES = [
+    (
+        "Event",
+        {
+            "name": "Diwali",
+            "event_date": date(2026, 11, 8),
+            "region": "india",
+            "theme_keywords": ["lights", "family", "rangoli"],
+            "recurrence": "annual_lunar",
+        },
+    ),
+    (
+        "WeeklyTheme",
+        {
+            "rotation_month": 1,
+            "day_of_week": "monday",
+            "theme_name": "Motivation Monday",
+            "tone_funny_pct": 30,
+            "tone_emotion_pct": 70,
+            "prompt_keywords": ["fresh start", "uplift"],
+            "color_palette": ["#2F6BFF", "#F1FAEE"],
+            "visual_style": "clean editorial illustration",
+            "instagram_hashtags": ["#MotivationMonday"],
+        },
+    ),
+    (
+        "ThemeOverride",
+        {
+            "override_type": "festival",
+            "event_id": 1,
+            "theme_name": "Festival Glow",
+            "tone_funny_pct": 25,
+            "tone_emotion_pct": 75,
+            "prompt_keywords": ["festival", "warmth"],
+            "color_palette": ["#FFD166", "#F4A261"],
+            "visual_style": "festive hand-lettering",
+            "instagram_hashtags": ["#FestivalGlow"],
+            "start_date": date(2026, 11, 1),
+            "end_date": date(2026, 11, 9),
+        },
+    ),
+    (
+        "DailyContentPlan",
+        {
+            "plan_date": date(2026, 11, 8),
+            "theme_name": "Festival Glow",
+            "source": "override",
+            "override_id": 1,
+            "weekly_theme_id": 1,
+            "tone_funny_pct": 25,
+            "tone_emotion_pct": 75,
+            "prompt_keywords": ["festival", "warmth"],
+            "color_palette": ["#FFD166", "#F4A261"],
+        },
+    ),
+    (
+        "Card",
+        {
+            "event_id": 1,
+            "theme_name": "Festival Glow",
+            "theme_source": "override",
+            "phrase": "Wishing you warmth, light, and joy.",
+        },
+    ),
+    (
+        "Listing",
+        {
+            "card_id": 1,
+            "platform": "etsy",
+            "listing_url": "https://example.com/listings/1",
+            "price": Decimal("5.99"),
+        },
+    ),
+    (
+        "Sale",
+        {
+            "listing_id": 1,
+            "platform": "etsy",
+            "gross_amount": Decimal("5.99"),
+            "platform_fee": Decimal("1.00"),
+        },
+    ),
+    ("SocialPost", {"card_id": 1, "platform": "instagram"}),
+    ("Watermark", {"card_id": 1, "phash": "a" * 64}),
+    (
+        "Alert",
+        {
+            "alert_type": "infringement",
+            "card_id": 1,
+            "infringing_url": "https://example.com/copycat",
+            "similarity_pct": 92,
+        },
+    ),
+    (
+        "Competitor",
+        {
+            "name": "Sample Seller",
+            "platform": "etsy",
+            "url": "https://example.com/sellers/sample",
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize(("model_name", "fields"), MODEL_CASES, ids=[name for name, _ in MODEL_CASES])
+def test_model_can_be_instantiated_and_represented(
+    configured_env: dict[str, str],
+    models,
+    model_name: str,
+    fields: dict,
+) -> None:
+    """Each ORM model should instantiate with its required fields and return a repr string."""
+
+    instance = getattr(models, model_name)(**fields)
+
+    assert isinstance(repr(instance), str)
+    for field_name, value in fields.items():
+        assert getattr(instance, field_name) == value
+
+
+def test_sale_net_amount_is_computed_from_gross_and_fee(configured_env: dict[str, str], models) -> None:
+    """Net amount is generated by the database from the gross amount and platform fee."""
+
+    table = models.Sale.__table__
+    computed = table.c.net_amount.computed
+    fee_check = next(
+        constraint for constraint in table.constraints if constraint.name == "ck_sales_platform_fee_within_gross"
+    )
 
-    models = reload_models_module()
+    assert computed.persisted is True
+    assert computed.sqltext.text == "gross_amount - platform_fee"
+    assert fee_check.sqltext.text == "platform_fee >= 0 AND gross_amount >= platform_fee"
 
-    event = models.Event(
-        name="Diwali",
-        event_date=date(2026, 11, 8),
-        region="india",
-        theme_keywords=["lights", "family", "rangoli"],
-        recurrence="annual_lunar",
-    )
-    weekly_theme = models.WeeklyTheme(
-        rotation_month=1,
-        day_of_week="monday",
-        theme_name="Motivation Monday",
-        tone_funny_pct=30,
-        tone_emotion_pct=70,
-        prompt_keywords=["fresh start", "uplift"],
-        color_palette=["#2F6BFF", "#F1FAEE"],
-        visual_style="clean editorial illustration",
-        instagram_hashtags=["#MotivationMonday"],
-    )
-    override = models.ThemeOverride(
-        override_type="festival",
-        event_id=1,
-        theme_name="Festival Glow",
-        tone_funny_pct=25,
-        tone_emotion_pct=75,
-        prompt_keywords=["festival", "warmth"],
-        color_palette=["#FFD166", "#F4A261"],
-        visual_style="festive hand-lettering",
-        instagram_hashtags=["#FestivalGlow"],
-        start_date=date(2026, 11, 1),
-        end_date=date(2026, 11, 9),
-    )
-    daily_plan = models.DailyContentPlan(
-        plan_date=date(2026, 11, 8),
-        theme_name="Festival Glow",
-        source="override",
-        override_id=1,
-        weekly_theme_id=1,
-        tone_funny_pct=25,
-        tone_emotion_pct=75,
-        prompt_keywords=["festival", "warmth"],
-        color_palette=["#FFD166", "#F4A261"],
-    )
-    card = models.Card(
-        event_id=1,
-        theme_name="Festival Glow",
-        theme_source="override",
-        phrase="Wishing you warmth, light, and joy.",
-    )
-    listing = models.Listing(
-        card_id=1,
-        platform="etsy",
-        listing_url="https://example.com/listings/1",
-        price=Decimal("5.99"),
-    )
-    sale = models.Sale(
-        listing_id=1,
-        platform="etsy",
-        gross_amount=Decimal("5.99"),
-        platform_fee=Decimal("1.00"),
-        net_amount=Decimal("4.99"),
-    )
-    social_post = models.SocialPost(card_id=1, platform="instagram")
-    watermark = models.Watermark(card_id=1, phash="a" * 64)
-    alert = models.Alert(
-        alert_type="infringement",
-        card_id=1,
-        infringing_url="https://example.com/copycat",
-        similarity_pct=92,
-    )
-    competitor = models.Competitor(
-        name="Sample Seller",
-        platform="etsy",
-        url="https://example.com/sellers/sample",
-    )
 
-    for instance in [
-        event,
-        weekly_theme,
-        override,
-        daily_plan,
-        card,
-        listing,
-        sale,
-        social_post,
-        watermark,
-        alert,
-        competitor,
-    ]:
-        assert isinstance(repr(instance), str)
-
-    assert event.name == "Diwali"
-    assert card.phrase.startswith("Wishing")
-    assert listing.platform == "etsy"
-    assert sale.net_amount == Decimal("4.99")
-    assert competitor.name == "Sample Seller"
-
-
-def test_model_defaults_are_configured(configured_env: dict[str, str]) -> None:
+def test_model_defaults_are_configured(configured_env: dict[str, str], models) -> None:
     """Important ORM defaults should be present without requiring a database round-trip."""
 
-    models = reload_models_module()
-
-    assert models.Event.__table__.c.lead_days.default.arg == 21
-    assert models.WeeklyTheme.__table__.c.active.default.arg is True
-    assert models.ThemeOverride.__table__.c.priority.default.arg == 10
-    assert models.ThemeOverride.__table__.c.created_by.default.arg == "system"
-    assert models.DailyContentPlan.__table__.c.cards_generated.default.arg == 0
-    assert models.DailyContentPlan.__table__.c.status.default.arg == "pending"
-    assert models.Card.__table__.c.status.default.arg == "pending_phrase_approval"
-    assert models.Card.__table__.c.candidate_phrases.default.arg.__name__ == "list"
-    assert models.Card.__table__.c.cost_llm.default.arg == Decimal("0.0000")
-    assert models.Card.__table__.c.cost_image.default.arg == Decimal("0.0400")
-    assert models.SocialPost.__table__.c.reach.default.arg == 0
-    assert models.Alert.__table__.c.status.default.arg == "pending"
+    defaults = {
+        (model.__name__, column.name): column.default.arg
+        for model in (
+            models.Event,
+            models.WeeklyTheme,
+            models.ThemeOverride,
+            models.DailyContentPlan,
+            models.Card,
+            models.SocialPost,
+            models.Alert,
+        )
+        for column in model.__table__.c
+        if column.default is not None
+    }
+
+    assert defaults[("Event", "lead_days")] == 21
+    assert defaults[("WeeklyTheme", "active")] is True
+    assert defaults[("ThemeOverride", "priority")] == 10
+    assert defaults[("ThemeOverride", "created_by")] == "system"
+    assert defaults[("DailyContentPlan", "cards_generated")] == 0
+    assert defaults[("DailyContentPlan", "status")] == "pending"
+    assert defaults[("DailyContentPlan", "visual_style")] == ""
+    assert defaults[("Card", "status")] == "pending_phrase_approval"
+    assert defaults[("Card", "candidate_phrases")].__name__ == "list"
+    assert defaults[("Card", "cost_llm")] == Decimal("0.0000")
+    assert defaults[("Card", "cost_image")] == Decimal("0.0400")
+    assert defaults[("SocialPost", "reach")] == 0
+    assert defaults[("Alert", "status")] == "pending"
     assert models.Card.__table__.c.created_at.server_default is not None
     assert models.Listing.__table__.c.listed_at.server_default is not None
     assert models.Sale.__table__.c.sale_date.server_default is not None
@@ -2,27 +2,40 @@
 
 from __future__ import annotations
 
+from functools import cache
 from io import BytesIO
-from unittest.mock import AsyncMock
-import importlib
-import sys
 
 import pytest
+import pytest_asyncio
 from PIL import Image, ImageDraw, ImageFont
 
+from tests._fakes import BaseFakeAsyncClient, FakeResponse
 
-def reload_pillow_service_module():
-    """Reload the Pillow service module so monkeypatches do not leak between tests."""
 
-    for module_name in list(sys.modules):
-        if module_name.startswith("app.services.pillow_service"):
-            sys.modules.pop(module_name, None)
+# Assembly cost scales with pixel count, so tests render at a small fraction of the
+# production and preview edge lengths (both above the fixed 2x40px border);
+# the size contracts are unchanged.
+TEST_CARD_SIZE = 210
+TEST_PREVIEW_SIZE = 120
 
-    return importlib.import_module("app.services.pillow_service")
 
+@pytest.fixture(scope="session")
+def service_module(import_app_module):
+    """Import the Pillow service once; monkeypatch undoes per-test patches on it."""
 
+    return import_app_module("app.services.pillow_service")
+
+
+@cache
+def default_font():
+    """Decode Pillow's built-in font once for the text wrapping tests."""
+
+    return ImageFont.load_default()
+
+
+@cache
 def create_test_image_bytes() -> bytes:
-    """Create a simple in-memory red PNG for mocked HTTP downloads."""
+    """Create a simple in-memory red PNG for mocked HTTP downloads, once per run."""
 
     image = Image.new("RGB", (100, 100), (220, 20, 60))
     output = BytesIO()
@@ -30,35 +43,36 @@ def create_test_image_bytes() -> bytes:
     return output.getvalue()
 
 
-class FakeResponse:
-    """Minimal httpx response stub for successful image downloads."""
-
-    def __init__(self, content: bytes):
-        self.content = content
-
-    def raise_for_status(self) -> None:
-        return None
-
-
-class FakeAsyncClient:
+class FakeAsyncClient(BaseFakeAsyncClient):
     """Minimal async httpx client stub with context-manager support."""
 
-    response_content = create_test_image_bytes()
-
     def __init__(self, *args, **kwargs):
-        self.get = AsyncMock(return_value=FakeResponse(self.response_content))
+        """Accept and ignore the httpx.AsyncClient constructor arguments."""
 
-    async def __aenter__(self):
-        return self
+    async def get(self, url, *args, **kwargs):
+        return FakeResponse(content=create_test_image_bytes())
 
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
 
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def assembled_card_bytes(service_module) -> bytes:
+    """Assemble one scaled-down production card per module for tests that only inspect its output."""
 
-def test_auto_font_size_returns_expected_breakpoints() -> None:
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(service_module.httpx, "AsyncClient", FakeAsyncClient)
+        patcher.setattr(service_module.PillowService, "PRODUCTION_SIZE", TEST_CARD_SIZE)
+        return await service_module.PillowService().assemble_card(
+            image_url="https://example.com/card.png",
+            phrase="Wishing you joy and light",
+            theme_name="Festival Glow",
+            color_palette=["#264653", "#2A9D8F"],
+            visual_style="clean illustration",
+            card_id=101,
+        )
+
+
+def test_auto_font_size_returns_expected_breakpoints(service_module) -> None:
     """Font sizing should follow the requested short, medium, and long rules."""
 
-    service_module = reload_pillow_service_module()
     service = service_module.PillowService()
 
     assert service._auto_font_size("Short lovely wish") == 72
@@ -68,14 +82,13 @@ def test_auto_font_size_returns_expected_breakpoints() -> None:
     ) == 44
 
 
-def test_wrap_text_splits_long_phrases_correctly() -> None:
+def test_wrap_text_splits_long_phrases_correctly(service_module) -> None:
     """Long phrases should wrap into multiple lines within the max width."""
 
-    service_module = reload_pillow_service_module()
     service = service_module.PillowService()
     image = Image.new("RGB", (400, 400), "white")
     draw = ImageDraw.Draw(image)
-    font = ImageFont.load_default()
+    font = default_font()
 
     lines = service._wrap_text(
         "This is a fairly long phrase intended to wrap across multiple lines neatly",
@@ -89,34 +102,90 @@ def test_wrap_text_splits_long_phrases_correctly() -> None:
         assert draw.textlength(line, font=font) <= 120
 
 
-@pytest.mark.asyncio
-async def test_assemble_card_returns_png_bytes_and_correct_dimensions(monkeypatch) -> None:
-    """Production card assembly should return PNG bytes at 2100x2100."""
+def test_wrap_text_slices_single_overlong_token_by_width(service_module) -> None:
+    """A single token wider than the max width should be sliced into fitting chunks."""
+
+    service = service_module.PillowService()
+    image = Image.new("RGB", (400, 400), "white")
+    draw = ImageDraw.Draw(image)
+    font = default_font()
+    token = "Supercalifragilisticexpialidocious" * 2
+
+    lines = service._wrap_text(token, font, 80, draw)
+
+    assert len(lines) > 1
+    assert "".join(lines) == token
+    for line in lines:
+        assert draw.textlength(line, font=font) <= 80
+
+
+def test_wrap_text_keeps_kerned_chunks_within_measured_width(service_module) -> None:
+    """Chunks sized from summed advances should still fit once kerning widens the measured text."""
+
+    class UnkernedFont:
+        def getlength(self, text):
+            return 10.0 * len(text)
+
+    class KerningDraw:
+        def textlength(self, text, font):
+            return font.getlength(text) + 5.0 * max(len(text) - 1, 0)
+
+    service = service_module.PillowService()
+    font = UnkernedFont()
+    draw = KerningDraw()
+    token = "abcdefghijklmnop"
+
+    lines = service._wrap_text(token, font, 50, draw)
+
+    assert "".join(lines) == token
+    for line in lines:
+        assert draw.textlength(line, font=font) <= 50
+
+
+def test_resolve_color_returns_rgb_tuple_and_falls_back_for_invalid_values(service_module) -> None:
+    """Palette colors should resolve to RGB tuples, with invalid values using the default border."""
+
+    assert service_module.resolve_color("#264653") == (38, 70, 83)
+    assert service_module.resolve_color("not-a-color") == (31, 41, 55)
+
+
+async def test_assemble_card_returns_png_bytes_and_correct_dimensions(assembled_card_bytes: bytes) -> None:
+    """Production card assembly should return square PNG bytes at the production size."""
+
+    assert isinstance(assembled_card_bytes, bytes)
+    assembled_image = Image.open(BytesIO(assembled_card_bytes))
+    assert assembled_image.format == "PNG"
+    assert assembled_image.size == (TEST_CARD_SIZE, TEST_CARD_SIZE)
+
+
+async def test_create_preview_returns_smaller_jpeg_than_full_card(
+    service_module,
+    assembled_card_bytes: bytes,
+    monkeypatch,
+) -> None:
+    """Preview generation should return a smaller square JPEG than the full card."""
 
-    service_module = reload_pillow_service_module()
     monkeypatch.setattr(service_module.httpx, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(service_module.PillowService, "PREVIEW_SIZE", TEST_PREVIEW_SIZE)
     service = service_module.PillowService()
 
-    result = await service.assemble_card(
+    preview = await service.create_preview(
         image_url="https://example.com/card.png",
         phrase="Wishing you joy and light",
-        theme_name="Festival Glow",
         color_palette=["#264653", "#2A9D8F"],
-        visual_style="clean illustration",
-        card_id=101,
     )
 
-    assert isinstance(result, bytes)
-    assembled_image = Image.open(BytesIO(result))
-    assert assembled_image.format == "PNG"
-    assert assembled_image.size == (2100, 2100)
+    assert isinstance(preview, bytes)
+    preview_image = Image.open(BytesIO(preview))
+    assert preview_image.format == "JPEG"
+    assert preview_image.size == (TEST_PREVIEW_SIZE, TEST_PREVIEW_SIZE)
+    assert len(preview) < len(assembled_card_bytes)
 
 
-@pytest.mark.asyncio
-async def test_create_preview_returns_smaller_jpeg_than_full_card(monkeypatch) -> None:
-    """Preview generation should return a smaller 800x800 JPEG than the full card."""
+@pytest.mark.slow
+async def test_assemble_card_and_preview_at_production_sizes(service_module, monkeypatch) -> None:
+    """Unscaled assembly should produce a 2100x2100 PNG card and a smaller 800x800 JPEG preview."""
 
-    service_module = reload_pillow_service_module()
     monkeypatch.setattr(service_module.httpx, "AsyncClient", FakeAsyncClient)
     service = service_module.PillowService()
 
@@ -134,8 +203,6 @@ async def test_create_preview_returns_smaller_jpeg_than_full_card(monkeypatch) -
         color_palette=["#264653", "#2A9D8F"],
     )
 
-    assert isinstance(preview, bytes)
-    preview_image = Image.open(BytesIO(preview))
-    assert preview_image.format == "JPEG"
-    assert preview_image.size == (800, 800)
+    assert Image.open(BytesIO(assembled)).size == (2100, 2100)
+    assert Image.open(BytesIO(preview)).size == (800, 800)
     assert len(preview) < len(assembled)
@@ -4,88 +4,50 @@ from __future__ import annotations
 
 from base64 import b64encode
 from unittest.mock import AsyncMock
-import importlib
-import sys
 
 import pytest
 
+from tests._fakes import BaseFakeAsyncClient, FakeResponse
 
-def reload_telegram_service_module():
-    """Reload the Telegram service module so test monkeypatches are isolated."""
+PREVIEW_BASE64 = b64encode(b"preview").decode()
 
-    for module_name in list(sys.modules):
-        if (
-            module_name in {"app.config", "app.database"}
-            or module_name.startswith("app.models")
-            or module_name.startswith("app.services.telegram_service")
-        ):
-            sys.modules.pop(module_name, None)
 
-    return importlib.import_module("app.services.telegram_service")
+@pytest.fixture(scope="session")
+def service_module(import_app_module):
+    """Import the Telegram service once; monkeypatch undoes per-test patches on it."""
 
+    return import_app_module("app.services.telegram_service")
 
-class FakeResponse:
-    """Minimal httpx response stub for Telegram API tests."""
 
-    def __init__(self, payload):
-        self.payload = payload
-
-    def raise_for_status(self) -> None:
-        return None
-
-    def json(self):
-        return self.payload
-
-
-class FakeAsyncClient:
+class FakeAsyncClient(BaseFakeAsyncClient):
     """Queued async client stub that captures Telegram Bot API requests."""
 
-    responses: list[dict] = []
-    posted_requests: list[dict] = []
-
-    def __init__(self, *args, **kwargs):
-        self.post = AsyncMock(side_effect=self._post)
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-
-    async def _post(self, url, *, data=None, files=None):
-        self.__class__.posted_requests.append({"url": url, "data": data, "files": files})
-        return FakeResponse(self.__class__.responses.pop(0))
+    def __init__(self, responses, posted_requests):
+        self.responses = responses
+        self.posted_requests = posted_requests
 
+    async def post(self, url, *, data=None, files=None):
+        self.posted_requests.append({"url": url, "data": data, "files": files})
+        return FakeResponse(json_data=self.responses.pop(0))
 
-class FakeSession:
-    """Simple async session stub for Telegram service tests."""
 
-    def __init__(self, card):
-        self.card = card
-        self.committed = False
+def make_client_factory(payloads):
+    """Return an httpx.AsyncClient stand-in and the list its clients record requests into."""
 
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-
-    async def get(self, model, card_id):
-        if self.card is not None and self.card.id == card_id:
-            return self.card
-        return None
+    responses = list(payloads)
+    posted_requests: list[dict] = []
 
-    async def commit(self):
-        self.committed = True
+    def factory(*args, **kwargs):
+        return FakeAsyncClient(responses, posted_requests)
 
+    return factory, posted_requests
 
-def make_session_factory(card):
-    """Return a session factory for the provided in-memory card object."""
 
-    def factory():
-        return FakeSession(card)
+@pytest.fixture(scope="module")
+def chat_id(configured_env: dict[str, str]) -> str:
+    """Return the approver chat id that webhook updates must come from."""
 
-    return factory
+    return configured_env["TELEGRAM_CHAT_ID"]
 
 
 def make_telegram_ok_payload(message_id: int = 101) -> dict:
@@ -94,26 +56,25 @@ def make_telegram_ok_payload(message_id: int = 101) -> dict:
     return {"ok": True, "result": {"message_id": message_id}}
 
 
-@pytest.mark.asyncio
 async def test_send_phrase_approval_returns_message_id_and_stores_candidates(
     configured_env: dict[str, str],
+    service_module,
+    card_cls,
+    session_factory,
     monkeypatch,
 ) -> None:
     """Phrase approval sends a Telegram message and stores the candidate phrases on the card."""
 
-    service_module = reload_telegram_service_module()
-    card_model = importlib.import_module("app.models.card")
-    card = card_model.Card(
+    card = card_cls(
         id=9,
         event_id=1,
         theme_name="Festival Glow",
         theme_source="weekly",
         phrase="Warm wishes always",
     )
-    FakeAsyncClient.responses = [make_telegram_ok_payload(321)]
-    FakeAsyncClient.posted_requests = []
-    monkeypatch.setattr(service_module.httpx, "AsyncClient", FakeAsyncClient)
-    service = service_module.TelegramService(session_factory=make_session_factory(card))
+    client_factory, posted_requests = make_client_factory([make_telegram_ok_payload(321)])
+    monkeypatch.setattr(service_module.httpx, "AsyncClient", client_factory)
+    service = service_module.TelegramService(session_factory=session_factory(card))
 
     result = await service.send_phrase_approval(
         card_id=9,
@@ -131,21 +92,20 @@ async def test_send_phrase_approval_returns_message_id_and_stores_candidates(
 
     assert result == {"message_id": 321, "sent": True}
     assert len(card.candidate_phrases) == 2
-    assert "\u2b50" in FakeAsyncClient.posted_requests[0]["data"]["text"]
+    assert "\u2b50" in posted_requests[0]["data"]["text"]
 
 
-@pytest.mark.asyncio
 async def test_send_image_approval_returns_message_id(
     configured_env: dict[str, str],
+    service_module,
+    session_factory,
     monkeypatch,
 ) -> None:
     """Image approval should post the image URL to Telegram as a photo."""
 
-    service_module = reload_telegram_service_module()
-    FakeAsyncClient.responses = [make_telegram_ok_payload(456)]
-    FakeAsyncClient.posted_requests = []
-    monkeypatch.setattr(service_module.httpx, "AsyncClient", FakeAsyncClient)
-    service = service_module.TelegramService(session_factory=make_session_factory(None))
+    client_factory, posted_requests = make_client_factory([make_telegram_ok_payload(456)])
+    monkeypatch.setattr(service_module.httpx, "AsyncClient", client_factory)
+    service = service_module.TelegramService(session_factory=session_factory(None))
 
     result = await service.send_image_approval(
         card_id=12,
@@ -155,21 +115,20 @@ async def test_send_image_approval_returns_message_id(
     )
 
     assert result == {"message_id": 456, "sent": True}
-    assert FakeAsyncClient.posted_requests[0]["data"]["photo"] == "https://example.com/image.png"
+    assert posted_requests[0]["data"]["photo"] == "https://example.com/image.png"
 
 
-@pytest.mark.asyncio
 async def test_send_final_approval_sends_preview_bytes(
     configured_env: dict[str, str],
+    service_module,
+    session_factory,
     monkeypatch,
 ) -> None:
     """Final approval should upload the preview bytes as multipart photo data."""
 
-    service_module = reload_telegram_service_module()
-    FakeAsyncClient.responses = [make_telegram_ok_payload(654)]
-    FakeAsyncClient.posted_requests = []
-    monkeypatch.setattr(service_module.httpx, "AsyncClient", FakeAsyncClient)
-    service = service_module.TelegramService(session_factory=make_session_factory(None))
+    client_factory, posted_requests = make_client_factory([make_telegram_ok_payload(654)])
+    monkeypatch.setattr(service_module.httpx, "AsyncClient", client_factory)
+    service = service_module.TelegramService(session_factory=session_factory(None))
 
     result = await service.send_final_approval(
         card_id=15,
@@ -180,169 +139,110 @@ async def test_send_final_approval_sends_preview_bytes(
     )
 
     assert result == {"message_id": 654, "sent": True}
-    assert FakeAsyncClient.posted_requests[0]["files"]["photo"][1] == b"preview-bytes"
+    assert posted_requests[0]["files"]["photo"][1] == b"preview-bytes"
 
 
-@pytest.mark.asyncio
 async def test_send_notification_returns_message_id(
     configured_env: dict[str, str],
+    service_module,
+    session_factory,
     monkeypatch,
 ) -> None:
     """Generic notifications should reuse the sendMessage Telegram path."""
 
-    service_module = reload_telegram_service_module()
-    FakeAsyncClient.responses = [make_telegram_ok_payload(777)]
-    FakeAsyncClient.posted_requests = []
-    monkeypatch.setattr(service_module.httpx, "AsyncClient", FakeAsyncClient)
-    service = service_module.TelegramService(session_factory=make_session_factory(None))
+    client_factory, posted_requests = make_client_factory([make_telegram_ok_payload(777)])
+    monkeypatch.setattr(service_module.httpx, "AsyncClient", client_factory)
+    service = service_module.TelegramService(session_factory=session_factory(None))
 
     result = await service.send_notification("All systems operational.")
 
     assert result == {"message_id": 777, "sent": True}
-    assert FakeAsyncClient.posted_requests[0]["url"].endswith("/sendMessage")
-
-
-@pytest.mark.asyncio
-async def test_process_webhook_approves_phrase_by_index(
-    configured_env: dict[str, str],
-    monkeypatch,
-) -> None:
-    """Approving a phrase should replace the card phrase with the chosen candidate."""
-
-    service_module = reload_telegram_service_module()
-    card_model = importlib.import_module("app.models.card")
-    card = card_model.Card(
-        id=3,
-        event_id=1,
-        theme_name="Festival Glow",
-        theme_source="weekly",
-        phrase="Original phrase",
-        candidate_phrases=[
-            {"text": "First option filled with light and sweet joy tonight!", "tone": "balanced"},
-            {"text": "Second option bringing softer hope and brighter smiles today!", "tone": "emotional"},
-        ],
-        status="pending_phrase_approval",
-    )
-    service = service_module.TelegramService(session_factory=make_session_factory(card))
-    monkeypatch.setattr(service, "send_notification", AsyncMock(return_value={"message_id": 1, "sent": True}))
-
-    result = await service.process_webhook(
-        {
-            "message": {
-                "chat": {"id": configured_env["TELEGRAM_CHAT_ID"]},
-                "text": "/approve_phrase_3_2",
-            }
-        }
-    )
-
-    assert result == {"action": "phrase_approved", "card_id": 3, "phrase_index": 2}
-    assert card.phrase == "Second option bringing softer hope and brighter smiles today!"
-    assert card.status == "phrase_approved"
-
-
-@pytest.mark.asyncio
-async def test_process_webhook_rejects_phrase(
-    configured_env: dict[str, str],
+    assert posted_requests[0]["url"].endswith("/sendMessage")
+
+
+WEBHOOK_CANDIDATE_PHRASES = [
+    {"text": "First option filled with light and sweet joy tonight!", "tone": "balanced"},
+    {"text": "Second option bringing softer hope and brighter smiles today!", "tone": "emotional"},
+]
+
+
+@pytest.mark.parametrize(
+    ("command", "initial_status", "expected_result", "expected_status"),
+    [
+        (
+            "/approve_phrase_3_2",
+            "pending_phrase_approval",
+            {"action": "phrase_approved", "card_id": 3, "phrase_index": 2},
+            "phrase_approved",
+        ),
+        ("/reject_phrase_4", "pending_phrase_approval", {"action": "phrase_rejected", "card_id": 4}, "rejected"),
+        ("/approve_image_5", "pending_image_approval", {"action": "image_approved", "card_id": 5}, "image_approved"),
+        ("/regenerate_6", "rejected", {"action": "regenerate_requested", "card_id": 6}, "pending_image"),
+    ],
+    ids=["approve-phrase", "reject-phrase", "approve-image", "regenerate"],
+)
+async def test_process_webhook_applies_review_command(
+    chat_id: str,
+    service_module,
+    card_cls,
+    session_factory,
     monkeypatch,
+    command: str,
+    initial_status: str,
+    expected_result: dict[str, object],
+    expected_status: str,
 ) -> None:
-    """Rejecting a phrase should mark the card as rejected."""
+    """Each review command should move the addressed card to its next workflow status."""
 
-    service_module = reload_telegram_service_module()
-    card_model = importlib.import_module("app.models.card")
-    card = card_model.Card(
-        id=4,
+    card = card_cls(
+        id=expected_result["card_id"],
         event_id=1,
         theme_name="Festival Glow",
         theme_source="weekly",
         phrase="Original phrase",
-        candidate_phrases=[{"text": "Option one", "tone": "balanced"}],
-        status="pending_phrase_approval",
+        candidate_phrases=WEBHOOK_CANDIDATE_PHRASES,
+        status=initial_status,
     )
-    service = service_module.TelegramService(session_factory=make_session_factory(card))
+    service = service_module.TelegramService(session_factory=session_factory(card))
     monkeypatch.setattr(service, "send_notification", AsyncMock(return_value={"message_id": 1, "sent": True}))
 
     result = await service.process_webhook(
         {
             "message": {
-                "chat": {"id": configured_env["TELEGRAM_CHAT_ID"]},
-                "text": "/reject_phrase_4",
+                "chat": {"id": chat_id},
+                "text": command,
             }
         }
     )
 
-    assert result == {"action": "phrase_rejected", "card_id": 4}
-    assert card.status == "rejected"
-
+    assert result == expected_result
+    assert card.status == expected_status
+    if "phrase_index" in expected_result:
+        assert card.phrase == WEBHOOK_CANDIDATE_PHRASES[expected_result["phrase_index"] - 1]["text"]
 
-@pytest.mark.asyncio
-async def test_process_webhook_approves_image(
-    configured_env: dict[str, str],
-    monkeypatch,
-) -> None:
-    """Approving an image should advance the card to image_approved."""
-
-    service_module = reload_telegram_service_module()
-    card_model = importlib.import_module("app.models.card")
-    card = card_model.Card(
-        id=5,
-        event_id=1,
-        theme_name="Festival Glow",
-        theme_source="weekly",
-        phrase="Warm wishes always",
-        status="pending_image_approval",
-    )
-    service = service_module.TelegramService(session_factory=make_session_factory(card))
-    monkeypatch.setattr(service, "send_notification", AsyncMock(return_value={"message_id": 1, "sent": True}))
 
-    result = await service.process_webhook(
-        {
-            "message": {
-                "chat": {"id": configured_env["TELEGRAM_CHAT_ID"]},
-                "text": "/approve_image_5",
-            }
-        }
-    )
+def test_decode_preview_base64_decodes_bytes(service_module) -> None:
+    """Router helper should decode base64 preview payloads into bytes."""
 
-    assert result == {"action": "image_approved", "card_id": 5}
-    assert card.status == "image_approved"
+    assert service_module.decode_preview_base64(PREVIEW_BASE64) == b"preview"
 
 
-@pytest.mark.asyncio
-async def test_process_webhook_requests_regeneration(
-    configured_env: dict[str, str],
-    monkeypatch,
-) -> None:
-    """The regenerate command should move the card back to pending_image."""
+def test_decode_preview_base64_rejects_oversized_payload(service_module) -> None:
+    """Oversized preview payloads should be rejected before decoding."""
 
-    service_module = reload_telegram_service_module()
-    card_model = importlib.import_module("app.models.card")
-    card = card_model.Card(
-        id=6,
-        event_id=1,
-        theme_name="Festival Glow",
-        theme_source="weekly",
-        phrase="Warm wishes always",
-        status="rejected",
-    )
-    service = service_module.TelegramService(session_factory=make_session_factory(card))
-    monkeypatch.setattr(service, "send_notification", AsyncMock(return_value={"message_id": 1, "sent": True}))
+    oversized = "A" * (service_module.MAX_PREVIEW_BASE64_LENGTH + 4)
 
-    result = await service.process_webhook(
-        {
-            "message": {
-                "chat": {"id": configured_env["TELEGRAM_CHAT_ID"]},
-                "text": "/regenerate_6",
-            }
-        }
-    )
+    with pytest.raises(service_module.HTTPException) as exc_info:
+        service_module.decode_preview_base64(oversized)
 
-    assert result == {"action": "regenerate_requested", "card_id": 6}
-    assert card.status == "pending_image"
+    assert exc_info.value.status_code == 413
 
 
-def test_decode_preview_base64_decodes_bytes(configured_env: dict[str, str]) -> None:
-    """Router helper should decode base64 preview payloads into bytes."""
+@pytest.mark.parametrize("payload", ["A", "cHJldmlldw==\u00e9"], ids=["malformed", "non-ascii"])
+def test_decode_preview_base64_rejects_invalid_payload(service_module, payload: str) -> None:
+    """Malformed or non-ASCII preview payloads should be rejected as unprocessable."""
 
-    service_module = reload_telegram_service_module()
+    with pytest.raises(service_module.HTTPException) as exc_info:
+        service_module.decode_preview_base64(payload)
 
-    assert service_module.decode_preview_base64(b64encode(b"preview").decode()) == b"preview"
+    assert exc_info.value.status_code == 422
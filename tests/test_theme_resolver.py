@@ -2,221 +2,284 @@
 
 from __future__ import annotations
 
+import re
 from datetime import date, datetime
-from types import SimpleNamespace
-from unittest.mock import AsyncMock
-import importlib
-import sys
 from zoneinfo import ZoneInfo
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
 
+KOLKATA = ZoneInfo("Asia/Kolkata")
+MONDAY_MORNING = datetime(2026, 1, 5, 8, 0, tzinfo=KOLKATA)
+TUESDAY_MORNING = datetime(2026, 2, 3, 8, 0, tzinfo=KOLKATA)
 
-class ScalarOneOrNoneResult:
-    """Minimal async-result stub that provides scalar_one_or_none()."""
 
-    def __init__(self, value):
-        self.value = value
+class MappingsResult:
+    """Minimal async-result stub that provides mappings().one()."""
 
-    def scalar_one_or_none(self):
-        return self.value
+    def __init__(self, row):
+        self.row = row
 
+    def mappings(self):
+        return self
 
-def reload_theme_service_module():
-    """Reload the resolver module so each test sees fresh app state."""
+    def one(self):
+        return self.row
 
-    for module_name in list(sys.modules):
-        if (
-            module_name in {"app.config", "app.database"}
-            or module_name.startswith("app.models")
-            or module_name.startswith("app.services")
-        ):
-            sys.modules.pop(module_name, None)
 
-    return importlib.import_module("app.services.theme_resolver")
+class StubAsyncSession:
+    """Async session stub that answers every statement with one row and records the calls.
 
+    Commits and rollbacks go through a real, unbound ORM session so the
+    resolver's commit listeners run exactly as they do in production.
+    """
 
-@pytest.mark.asyncio
-async def test_resolve_today_uses_weekly_source_when_no_override(
-    configured_env: dict[str, str],
+    def __init__(self, row):
+        self.row = row
+        self.executed: list[tuple[object, dict[str, object]]] = []
+        self.commit_count = 0
+        self.sync_session = Session()
+        self.info = self.sync_session.info
+
+    async def execute(self, statement, params):
+        if not self.sync_session.in_transaction():
+            self.sync_session.begin()
+        self.executed.append((statement, params))
+        return MappingsResult(self.row)
+
+    async def commit(self):
+        self.commit_count += 1
+        self.sync_session.commit()
+
+    async def rollback(self):
+        self.sync_session.rollback()
+
+
+def make_theme_row(source: str, **overrides) -> dict[str, object]:
+    """Build the winning candidate row as returned by the resolver's single statement."""
+
+    row: dict[str, object] = {
+        "rank": {"override": 0, "weekly": 1}.get(source, 2),
+        "source": source,
+        "override_id": None,
+        "weekly_theme_id": None,
+        "theme_name": "Theme",
+        "tone_funny_pct": 50,
+        "tone_emotion_pct": 50,
+        "prompt_keywords": [],
+        "color_palette": [],
+        "visual_style": "",
+        "instagram_hashtags": [],
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def service_module(import_app_module):
+    """Share one resolver module import, clearing its class-level theme cache per test."""
+
+    module = import_app_module("app.services.theme_resolver")
+    module.ThemeResolver.invalidate()
+    return module
+
+
+WEEKLY_ROW = make_theme_row(
+    "weekly",
+    weekly_theme_id=11,
+    theme_name="Motivation Monday",
+    tone_funny_pct=30,
+    tone_emotion_pct=70,
+    prompt_keywords=["fresh start", "uplift"],
+    color_palette=["#2F6BFF", "#F1FAEE"],
+    visual_style="clean editorial illustration",
+    instagram_hashtags=["#MotivationMonday"],
+)
+OVERRIDE_ROW = make_theme_row(
+    "override",
+    override_id=22,
+    theme_name="Festival Override",
+    tone_funny_pct=25,
+    tone_emotion_pct=75,
+    prompt_keywords=["festival", "warmth"],
+    color_palette=["#FFD166"],
+    visual_style="festive lettering",
+    instagram_hashtags=["#FestivalMode"],
+)
+FALLBACK_ROW = make_theme_row("fallback", theme_name="Relatable / Everyday", tone_funny_pct=70, tone_emotion_pct=30)
+MONDAY_PARAMS = {"plan_date": date(2026, 1, 5), "rotation_month": 1, "weekday_name": "monday"}
+TUESDAY_PARAMS = {"plan_date": date(2026, 2, 3), "rotation_month": 2, "weekday_name": "tuesday"}
+RESOLVED_THEME_KEYS = (
+    "theme_name",
+    "source",
+    "tone_funny_pct",
+    "tone_emotion_pct",
+    "prompt_keywords",
+    "color_palette",
+    "visual_style",
+    "instagram_hashtags",
+)
+
+
+@pytest.mark.parametrize(
+    ("now", "row", "expected_params"),
+    [
+        (MONDAY_MORNING, WEEKLY_ROW, MONDAY_PARAMS),
+        (MONDAY_MORNING, OVERRIDE_ROW, MONDAY_PARAMS),
+        (TUESDAY_MORNING, FALLBACK_ROW, TUESDAY_PARAMS),
+    ],
+    ids=["weekly", "override", "fallback"],
+)
+async def test_resolve_today_returns_winning_source(
+    service_module,
+    now: datetime,
+    row: dict[str, object],
+    expected_params: dict[str, object],
 ) -> None:
-    """Weekly themes should be used when no override applies for the day."""
+    """One statement should carry the day's params and map whichever row wins onto the theme payload."""
 
-    service_module = reload_theme_service_module()
-    resolver = service_module.ThemeResolver(
-        now_provider=lambda: datetime(2026, 1, 5, 8, 0, tzinfo=ZoneInfo("Asia/Kolkata"))
-    )
-    session = AsyncMock(spec=AsyncSession)
-    weekly_theme = SimpleNamespace(
-        id=11,
-        theme_name="Motivation Monday",
-        tone_funny_pct=30,
-        tone_emotion_pct=70,
-        prompt_keywords=["fresh start", "uplift"],
-        color_palette=["#2F6BFF", "#F1FAEE"],
-        visual_style="clean editorial illustration",
-        instagram_hashtags=["#MotivationMonday"],
-    )
-    session.execute = AsyncMock(
-        side_effect=[
-            ScalarOneOrNoneResult(None),
-            ScalarOneOrNoneResult(weekly_theme),
-            object(),
-        ]
-    )
-    session.commit = AsyncMock()
+    resolver = service_module.ThemeResolver(now_provider=lambda: now)
+    session = StubAsyncSession(row)
 
     resolved = await resolver.resolve_today(session)
 
-    assert resolved["source"] == "weekly"
+    assert len(session.executed) == 1
+    statement, params = session.executed[0]
+    assert params == expected_params
+    compiled_params = statement.compile(dialect=postgresql.dialect()).params
+    assert service_module.FALLBACK_THEME["theme_name"] in compiled_params.values()
+    assert session.commit_count == 0
     assert resolved == {
-        "theme_name": "Motivation Monday",
-        "source": "weekly",
-        "tone_funny_pct": 30,
-        "tone_emotion_pct": 70,
-        "prompt_keywords": ["fresh start", "uplift"],
-        "color_palette": ["#2F6BFF", "#F1FAEE"],
-        "visual_style": "clean editorial illustration",
-        "instagram_hashtags": ["#MotivationMonday"],
-        "plan_date": "2026-01-05",
+        **{key: row[key] for key in RESOLVED_THEME_KEYS},
+        "plan_date": expected_params["plan_date"].isoformat(),
     }
 
 
-@pytest.mark.asyncio
-async def test_resolve_today_uses_override_source_when_override_exists(
-    configured_env: dict[str, str],
-) -> None:
-    """Overrides should win before any weekly theme lookup occurs."""
+def test_resolve_statement_ranks_override_then_weekly_then_fallback(service_module) -> None:
+    """The chosen row should be the lowest-ranked candidate: override, then weekly, then fallback."""
 
-    service_module = reload_theme_service_module()
-    resolver = service_module.ThemeResolver(
-        now_provider=lambda: datetime(2026, 1, 5, 8, 0, tzinfo=ZoneInfo("Asia/Kolkata"))
-    )
-    session = AsyncMock(spec=AsyncSession)
-    override = SimpleNamespace(
-        id=22,
-        theme_name="Festival Override",
-        tone_funny_pct=25,
-        tone_emotion_pct=75,
-        prompt_keywords=["festival", "warmth"],
-        color_palette=["#FFD166"],
-        visual_style="festive lettering",
-        instagram_hashtags=["#FestivalMode"],
-    )
-    session.execute = AsyncMock(
-        side_effect=[
-            ScalarOneOrNoneResult(override),
-            object(),
-        ]
+    chosen = service_module.RESOLVE_TODAY_STATEMENT.get_final_froms()[0]
+    candidates = chosen.element.get_final_froms()[0]
+
+    ranked_sources = [
+        tuple(getattr(column, "element", column).value for column in select.selected_columns[:2])
+        for select in candidates.element.selects
+    ]
+    assert ranked_sources == [(0, "override"), (1, "weekly"), (2, "fallback")]
+
+    compiled_override = candidates.element.selects[0].compile(dialect=postgresql.dialect())
+    assert "ORDER BY ecard_factory.theme_overrides.priority DESC" in str(compiled_override)
+
+    compiled_chosen = chosen.element.compile(dialect=postgresql.dialect())
+    limit = re.search(
+        r"FROM candidates ORDER BY candidates\.rank LIMIT %\((\w+)\)s$",
+        " ".join(str(compiled_chosen).split()),
     )
-    session.commit = AsyncMock()
+    assert limit is not None
+    assert compiled_chosen.params[limit.group(1)] == 1
 
-    resolved = await resolver.resolve_today(session)
 
-    assert resolved["source"] == "override"
-    assert resolved["theme_name"] == "Festival Override"
-    assert session.execute.await_count == 2
+def test_rotation_month_matches_explicit_formula(service_module) -> None:
+    """Rotation month should follow the explicit ((month - 1) % 9) + 1 formula."""
 
+    get_rotation_month = service_module.ThemeResolver.get_rotation_month
 
-@pytest.mark.asyncio
-async def test_resolve_today_uses_fallback_when_no_theme_data(
+    assert get_rotation_month(1) == 1
+    assert get_rotation_month(4) == 4
+    assert get_rotation_month(10) == 1
+
+
+async def test_resolve_today_is_idempotent_for_same_day(
     configured_env: dict[str, str],
+    service_module,
 ) -> None:
-    """Fallback data should be returned when neither source produces a theme."""
+    """Running the resolver twice on the same day should not create duplicates."""
 
-    service_module = reload_theme_service_module()
-    resolver = service_module.ThemeResolver(
-        now_provider=lambda: datetime(2026, 2, 3, 8, 0, tzinfo=ZoneInfo("Asia/Kolkata"))
-    )
-    session = AsyncMock(spec=AsyncSession)
-    session.execute = AsyncMock(
-        side_effect=[
-            ScalarOneOrNoneResult(None),
-            ScalarOneOrNoneResult(None),
-            object(),
-        ]
-    )
-    session.commit = AsyncMock()
+    resolver = service_module.ThemeResolver(now_provider=lambda: MONDAY_MORNING)
+    session = StubAsyncSession(WEEKLY_ROW)
 
-    resolved = await resolver.resolve_today(session)
+    first = await resolver.resolve_today(session)
+    second = await resolver.resolve_today(session)
 
-    assert resolved == {
-        "theme_name": "Relatable / Everyday",
-        "source": "fallback",
-        "tone_funny_pct": 70,
-        "tone_emotion_pct": 30,
-        "prompt_keywords": [],
-        "color_palette": [],
-        "visual_style": "",
-        "instagram_hashtags": [],
-        "plan_date": "2026-02-03",
-    }
+    assert first == second
+    for statement, _ in session.executed:
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (plan_date) DO UPDATE" in sql
+        assert "IS DISTINCT FROM excluded.theme_name" in sql
+    stored_plan_dates = {params["plan_date"] for _, params in session.executed}
+    assert stored_plan_dates == {date(2026, 1, 5)}
 
 
-def test_rotation_month_matches_explicit_formula(
+async def test_resolve_today_serves_cached_theme_until_invalidated(
     configured_env: dict[str, str],
+    service_module,
 ) -> None:
-    """Rotation month should follow the explicit ((month - 1) % 9) + 1 formula."""
+    """Repeat same-day calls should skip the database until an override invalidates the cache."""
 
-    service_module = reload_theme_service_module()
-    resolver = service_module.ThemeResolver()
+    resolver = service_module.ThemeResolver(now_provider=lambda: TUESDAY_MORNING)
+    session = StubAsyncSession(make_theme_row("fallback"))
 
-    assert resolver.get_rotation_month(1) == 1
-    assert resolver.get_rotation_month(4) == 4
-    assert resolver.get_rotation_month(10) == 1
+    first = await resolver.resolve_today(session)
+    await session.commit()
+    first["prompt_keywords"].append("mutated by caller")
+    second = await resolver.resolve_today(session)
 
+    assert len(session.executed) == 1
+    assert second["prompt_keywords"] == []
 
-@pytest.mark.asyncio
-async def test_resolve_today_is_idempotent_for_same_day(
+    service_module.ThemeResolver.invalidate()
+    await resolver.resolve_today(session)
+
+    assert len(session.executed) == 2
+
+
+async def test_resolve_today_does_not_cache_uncommitted_or_rolled_back_plans(
     configured_env: dict[str, str],
+    service_module,
 ) -> None:
-    """Running the resolver twice on the same day should not create duplicates."""
+    """Only a committed daily plan upsert should be served from the cache."""
 
-    service_module = reload_theme_service_module()
-    resolver = service_module.ThemeResolver(
-        now_provider=lambda: datetime(2026, 1, 5, 8, 0, tzinfo=ZoneInfo("Asia/Kolkata"))
-    )
-    session = AsyncMock(spec=AsyncSession)
-    stored_rows: dict[date, dict[str, object]] = {}
-    weekly_theme = SimpleNamespace(
-        id=11,
-        theme_name="Motivation Monday",
-        tone_funny_pct=30,
-        tone_emotion_pct=70,
-        prompt_keywords=["fresh start"],
-        color_palette=["#2F6BFF"],
-        visual_style="clean editorial illustration",
-        instagram_hashtags=["#MotivationMonday"],
-    )
+    resolver = service_module.ThemeResolver(now_provider=lambda: TUESDAY_MORNING)
+    session = StubAsyncSession(make_theme_row("fallback"))
 
-    async def execute_side_effect(statement):
-        entity = None
-        if hasattr(statement, "column_descriptions") and statement.column_descriptions:
-            entity = statement.column_descriptions[0].get("entity")
+    await resolver.resolve_today(session)
+    await resolver.resolve_today(session)
+    assert len(session.executed) == 2
 
-        if entity is not None and entity.__name__ == "ThemeOverride":
-            return ScalarOneOrNoneResult(None)
+    await session.rollback()
+    await session.commit()
+    await resolver.resolve_today(session)
 
-        if entity is not None and entity.__name__ == "WeeklyTheme":
-            return ScalarOneOrNoneResult(weekly_theme)
+    assert len(session.executed) == 3
 
-        if getattr(statement, "table", None) is not None and statement.table.name == "daily_content_plan":
-            values = {
-                getattr(key, "name", str(key)): getattr(value, "value", value)
-                for key, value in statement._values.items()
-            }
-            stored_rows[values["plan_date"]] = values
-            return object()
 
-        return object()
+async def test_resolve_today_rereads_after_cache_ttl(
+    configured_env: dict[str, str],
+    service_module,
+    monkeypatch,
+) -> None:
+    """Committed entries expire so changes made outside this process are picked up."""
 
-    session.execute = AsyncMock(side_effect=execute_side_effect)
-    session.commit = AsyncMock()
+    monkeypatch.setattr(service_module, "THEME_CACHE_TTL_SECONDS", 0.0)
+    resolver = service_module.ThemeResolver(now_provider=lambda: TUESDAY_MORNING)
+    session = StubAsyncSession(make_theme_row("fallback"))
 
-    first = await resolver.resolve_today(session)
-    second = await resolver.resolve_today(session)
+    await resolver.resolve_today(session)
+    await session.commit()
+    await resolver.resolve_today(session)
 
-    assert first == second
-    assert len(stored_rows) == 1
-    assert date(2026, 1, 5) in stored_rows
+    assert len(session.executed) == 2
+
+
+def test_get_now_normalizes_injected_clock_to_kolkata(
+    configured_env: dict[str, str],
+    service_module,
+) -> None:
+    """Injected clocks in other zones should be normalized to the Kolkata date."""
+
+    resolver = service_module.ThemeResolver(
+        now_provider=lambda: datetime(2026, 1, 4, 20, 0, tzinfo=ZoneInfo("UTC"))
+    )
+
+    assert resolver._get_now().date() == date(2026, 1, 5)